@@ -2,6 +2,7 @@
 
 import click
 import typer
+from typer.models import ParameterInfo
 
 
 def help_callback(ctx: click.Context, param: click.Parameter, value: bool):
@@ -11,6 +12,29 @@ def help_callback(ctx: click.Context, param: click.Parameter, value: bool):
         raise typer.Exit()
 
 
+def unwrap_default(value):
+    """Return the default of a typer Option/Argument placeholder, else the value.
+
+    Commands are also called directly as plain functions (tests, other
+    commands); then unpassed parameters still hold their typer.Option(...)
+    or typer.Argument(...) objects.
+    """
+    if isinstance(value, ParameterInfo):
+        return value.default
+    return value
+
+
+def row_formatter(*widths, indent: str = ""):
+    """Return a ``str.format`` that left-aligns columns to the given widths.
+
+    The widths are baked into the format string once, so each row is a single
+    format call. A width of ``None`` leaves that column unpadded (e.g. for
+    already padded, ANSI-styled values).
+    """
+    specs = ("{}" if w is None else f"{{:<{w}}}" for w in widths)
+    return (indent + "  ".join(specs)).format
+
+
 def add_help_option(help_text: str = "Show this message and exit."):
     """Create a help option with -h alias."""
     return typer.Option(False, "-h", "--help", callback=help_callback, is_eager=True, help=help_text)
@@ -1,13 +1,14 @@
 from __future__ import annotations
 import typer
-from idflow.core.fs_markdown import FSMarkdownDocument
+from ..common import unwrap_default
 
 def drop(
     uuid: str = typer.Argument(...),
 ):
+    from idflow.core.fs_markdown import FSMarkdownDocument
+
     # Extract default values from typer objects for direct function calls
-    if hasattr(uuid, 'default'):
-        uuid = uuid.default
+    uuid = unwrap_default(uuid)
 
     # Find the document using ORM
     doc = FSMarkdownDocument.find(uuid)
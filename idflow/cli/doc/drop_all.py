@@ -1,14 +1,15 @@
 from __future__ import annotations
 import typer
-from idflow.core.fs_markdown import FSMarkdownDocument
+from ..common import unwrap_default
 
 def drop_all(
     status: str = typer.Argument(..., help="Status to filter by: inbox, active, done, archived, or all"),
     force: bool = typer.Option(False, "--force", help="delete without confirmation"),
 ):
+    from idflow.core.fs_markdown import FSMarkdownDocument
+
     # Extract default values from typer.Option objects for direct function calls
-    if hasattr(force, 'default'):
-        force = force.default
+    force = unwrap_default(force)
 
     # Validate status parameter
     valid_statuses = {'inbox', 'active', 'done', 'archived', 'all'}
@@ -2,9 +2,8 @@ from __future__ import annotations
 import json
 import typer
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from idflow.core.fs_markdown import FSMarkdownDocument
-from idflow.core.filters import match_filter
+from typing import Any, Callable, Dict, List, Optional
+from ..common import unwrap_default
 
 app = typer.Typer(add_completion=False)
 
@@ -22,6 +21,16 @@ def _get_dot(fm: Dict[str, Any], path: str) -> Any:
             return None
     return cur
 
+def _body_preview(doc: Dict[str, Any]) -> str:
+    body = doc.get("body", "")
+    return body[:100] + "..." if len(body) > 100 else body
+
+def _column_getter(col: str) -> Callable[[Dict[str, Any]], Any]:
+    """Resolve an output column to its value getter once per list call."""
+    if col == "body":
+        return _body_preview
+    return lambda doc: doc.get(col, "")
+
 @app.command("list")
 def list_docs(
     filter_: List[str] = typer.Option(None, "--filter", help='property=EXPR (z.B. title="observ*" | priority=">0.5" | meta.owner="exists" | doc-ref="key")'),
@@ -34,11 +43,11 @@ def list_docs(
     exists: Optional[str] = None,
     tags: Optional[str] = None,
 ):
+    from idflow.core.fs_markdown import FSMarkdownDocument
+    from idflow.core.filters import compile_filter
+
     # Extract default values from typer objects for direct function calls
-    if hasattr(filter_, 'default'):
-        filter_ = filter_.default
-    if hasattr(col, 'default'):
-        col = col.default
+    filter_, col = map(unwrap_default, (filter_, col))
 
     # Build filters from individual parameters
     filters = []
@@ -62,12 +71,15 @@ def list_docs(
     # Use columns parameter if provided, otherwise use col
     cols = columns or col or ["id"]
 
-    # Convert filters to ORM query format
+    # Convert filters to ORM query format; predicates for the post-filter
+    # are compiled once here rather than re-parsed for every document
     query_filters = {}
+    post_filters = []
     for f in filters:
         prop, expr = _parse_prop_eq_val(f, "--filter")
         prop = prop.strip()
         expr = expr.strip().strip('"').strip("'")
+        post_filters.append((prop, expr, compile_filter(expr)))
 
         if prop == "doc-ref":
             query_filters["doc_ref"] = expr
@@ -88,19 +100,13 @@ def list_docs(
         filtered = []
         for doc in docs:
             passes = True
-            for f in filters:
-                prop, expr = _parse_prop_eq_val(f, "--filter")
-                prop = prop.strip()
-                expr = expr.strip().strip('"').strip("'")
-
+            for prop, expr, predicate in post_filters:
                 if prop == "doc-ref":
-                    keys = {x.key for x in doc.doc_refs}
-                    if expr not in keys:
+                    if not any(x.key == expr for x in doc.doc_refs):
                         passes = False
                         break
                 elif prop == "file-ref":
-                    keys = {x.key for x in doc.file_refs}
-                    if expr not in keys:
+                    if not any(x.key == expr for x in doc.file_refs):
                         passes = False
                         break
                 else:
@@ -108,7 +114,7 @@ def list_docs(
                     if val is None and expr != "exists":
                         passes = False
                         break
-                    if not match_filter(val, expr):
+                    if not predicate(val):
                         passes = False
                         break
 
@@ -121,34 +127,26 @@ def list_docs(
         typer.echo("No documents found.")
         return
 
-    # Convert to list of dictionaries for output
-    result_docs = []
-    for doc in docs:
-        doc_dict = doc.to_dict()
-        doc_dict["_doc_path"] = str(doc.doc_file)
-        result_docs.append(doc_dict)
-
-    # Output in requested format
+    # Output in requested format; rows are buffered and written at once
+    out: List[str] = []
+    append = out.append
     if len(cols) == 1 and cols[0] == "id":
         # Simple ID list
         for doc in docs:
-            typer.echo(doc.id)
+            append(doc.id)
     else:
         # Detailed output
-        for doc in result_docs:
-            output = {}
-            for col in cols:
-                if col == "id":
-                    output[col] = doc.get("id", "")
-                elif col == "status":
-                    output[col] = doc.get("status", "")
-                elif col == "body":
-                    output[col] = doc.get("body", "")[:100] + "..." if len(doc.get("body", "")) > 100 else doc.get("body", "")
-                else:
-                    output[col] = doc.get(col, "")
+        getters = [(c, _column_getter(c)) for c in cols]
+        for doc in docs:
+            doc_dict = doc.to_dict()
+            doc_dict["_doc_path"] = str(doc.doc_file)
+            output = {c: get(doc_dict) for c, get in getters}
 
             if len(cols) == 1:
-                typer.echo(output[cols[0]])
+                value = output[cols[0]]
+                append("" if value is None else str(value))
             else:
-                typer.echo(json.dumps(output, ensure_ascii=False))
+                append(json.dumps(output, ensure_ascii=False))
+
+    typer.echo("\n".join(out))
 
@@ -4,7 +4,7 @@ Locate command for finding document paths by UUID.
 """
 
 import typer
-from idflow.core.fs_markdown import FSMarkdownDocument
+from ..common import unwrap_default
 
 def locate(
     uuid: str = typer.Argument(..., help="Document UUID to locate"),
@@ -15,9 +15,10 @@ def locate(
     This is useful for finding where a document is stored after creation
     or for scripting purposes.
     """
+    from idflow.core.fs_markdown import FSMarkdownDocument
+
     # Extract default values from typer objects for direct function calls
-    if hasattr(uuid, 'default'):
-        uuid = uuid.default
+    uuid = unwrap_default(uuid)
 
     # Find the document using ORM
     doc = FSMarkdownDocument.find(uuid)
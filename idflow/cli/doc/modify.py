@@ -5,7 +5,7 @@ from typing import Optional, List, Any, Dict, Tuple
 from uuid import uuid4
 
 import typer
-from idflow.core.document_factory import get_document_class
+from ..common import unwrap_default
 
 def _parse_prop_eq_val(arg: str, flag: str) -> tuple[str, str]:
     if "=" not in arg:
@@ -42,25 +42,13 @@ def modify(
     add_file: List[str] = typer.Option(None, "--add-file", help="file_key=./path"),
     file_data: List[str] = typer.Option(None, "--file-data", help="JSON for last added file"),
 ):
+    from idflow.core.document_factory import get_document_class
+
     # Extract default values from typer objects for direct function calls
-    if hasattr(uuid, 'default'):
-        uuid = uuid.default
-    if hasattr(body_arg, 'default'):
-        body_arg = body_arg.default
-    if hasattr(set_, 'default'):
-        set_ = set_.default
-    if hasattr(list_add, 'default'):
-        list_add = list_add.default
-    if hasattr(json_kv, 'default'):
-        json_kv = json_kv.default
-    if hasattr(add_doc, 'default'):
-        add_doc = add_doc.default
-    if hasattr(doc_data, 'default'):
-        doc_data = doc_data.default
-    if hasattr(add_file, 'default'):
-        add_file = add_file.default
-    if hasattr(file_data, 'default'):
-        file_data = file_data.default
+    uuid, body_arg, set_, list_add, json_kv, add_doc, doc_data, add_file, file_data = map(
+        unwrap_default,
+        (uuid, body_arg, set_, list_add, json_kv, add_doc, doc_data, add_file, file_data),
+    )
 
     # Get document class from factory
     DocumentClass = get_document_class()
@@ -83,27 +71,17 @@ def modify(
     # --list-add
     for item in list_add or []:
         prop, val = _parse_prop_eq_val(item, "--list-add")
-        # Parse the property path
-        parts = prop.split(".")
+        # Navigate to the parent of the target property in a single pass
+        *parents, target_prop = prop.split(".")
         cur = doc._data
+        for p in parents:
+            cur = cur.setdefault(p, {})
 
-        # Navigate to the parent of the target property
-        for p in parts[:-1]:
-            if p not in cur:
-                cur[p] = {}
-            cur = cur[p]
-
-        # Get the target property name
-        target_prop = parts[-1]
-
-        # Initialize the list if it doesn't exist
-        if target_prop not in cur:
-            cur[target_prop] = []
-        elif not isinstance(cur[target_prop], list):
+        # Initialize the list if it doesn't exist, then append
+        lst = cur.setdefault(target_prop, [])
+        if not isinstance(lst, list):
             raise typer.BadParameter(f"{prop} is not a list.")
-
-        # Append the value
-        cur[target_prop].append(val)
+        lst.append(val)
 
     # --json
     for item in json_kv or []:
@@ -121,14 +99,15 @@ def modify(
             doc.add_doc_ref(key=key.strip(), uuid=uuid_ref.strip())
 
         # Add data to the last added doc ref
+        doc_refs = doc.doc_refs
         for js in doc_data or []:
-            if not doc.doc_refs:
+            if not doc_refs:
                 raise typer.BadParameter("--doc-data without existing --add-doc")
             try:
                 d = json.loads(js) if js else {}
             except json.JSONDecodeError as e:
                 raise typer.BadParameter(f"--doc-data JSON invalid: {e}")
-            doc.doc_refs[-1].data = d
+            doc_refs[-1].data = d
 
     # _file_refs
     pending_files: List[tuple[Path, str]] = []
@@ -1,17 +1,16 @@
 from __future__ import annotations
 import typer
-from idflow.core.fs_markdown import FSMarkdownDocument
-from idflow.core.models import VALID_STATUS
+from ..common import unwrap_default
 
 def set_status(
     uuid: str = typer.Argument(...),
     status: str = typer.Argument(...),
 ):
+    from idflow.core.fs_markdown import FSMarkdownDocument
+    from idflow.core.models import VALID_STATUS
+
     # Extract default values from typer objects for direct function calls
-    if hasattr(uuid, 'default'):
-        uuid = uuid.default
-    if hasattr(status, 'default'):
-        status = status.default
+    uuid, status = map(unwrap_default, (uuid, status))
 
     if status not in VALID_STATUS:
         raise typer.BadParameter(f"status must be one of {sorted(VALID_STATUS)}.")
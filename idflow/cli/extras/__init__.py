@@ -1,4 +1,9 @@
 from __future__ import annotations
+import functools
+import importlib.metadata
+import re
+import subprocess
+import sys
 import typer
 from typing import List
 
@@ -23,25 +28,70 @@ def extras_main(
     pass
 
 
-def _gather_required_features_with_stages() -> dict[str, list[str]]:
-    """Return mapping feature -> list of stage names that require it (only active stages)."""
-    stage_defs = get_stage_definitions()
+# Requires-Dist value: "<requirement>[; <marker>]"
+_REQUIRES_DIST_RE = re.compile(r"^\s*([^;\s]+)[^;]*(?:;\s*(.*))?$")
+
+
+# Leading distribution name of a requirement spec (PEP 508 name characters)
+_REQ_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def _extract_name(req: str) -> str:
+    """Extract the base distribution name from a requirement spec."""
+    m = _REQ_NAME_RE.match(req)
+    return m.group(1) if m else req.split(";", 1)[0].strip()
+
+
+def _idflow_base_requires() -> frozenset[str]:
+    """Distribution names of idflow's base (non-extra) runtime dependencies."""
+    dist = importlib.metadata.distribution("idflow")
+    names = set()
+    for value in dist.requires or []:
+        m = _REQUIRES_DIST_RE.match(value)
+        if not m:
+            continue
+        # Skip entries that are only for extras (we only want base deps)
+        if "extra ==" in (m.group(2) or ""):
+            continue
+        names.add(_extract_name(m.group(1)))
+    return frozenset(names)
+
+
+# The lookups below walk stage definitions, extras.d files and installed
+# distributions. They are memoized for the lifetime of the CLI process so
+# chained commands (sync -> install + purge) resolve them only once.
+@functools.lru_cache(maxsize=1)
+def _available_features() -> dict[str, list[str]]:
+    return get_available_features()
+
+
+@functools.lru_cache(maxsize=1)
+def _installed_features() -> tuple[str, ...]:
+    return tuple(get_installed_optional_dependencies())
+
+
+@functools.lru_cache(maxsize=1)
+def _feature_origin_map() -> dict[str, str]:
+    return get_feature_origin_map()
+
+
+@functools.lru_cache(maxsize=1)
+def _gather_required_features_with_stages() -> dict[str, tuple[str, ...]]:
+    """Return mapping feature -> stage names that require it (only active stages)."""
     mapping: dict[str, set[str]] = {}
-    for stage_name in stage_defs.list_definitions():
-        sd = stage_defs.get_definition(stage_name)
-        if not sd or not sd.active or not sd.requirements:
+    for stage_name, sd in get_stage_definitions().iter_definitions():
+        if not sd.active or not sd.requirements:
             continue
-        feats = (sd.requirements.extras) or []
-        for feature in feats:
+        for feature in sd.requirements.extras or []:
             mapping.setdefault(feature, set()).add(stage_name)
-    return {k: sorted(list(v)) for k, v in mapping.items()}
+    return {k: tuple(sorted(v)) for k, v in mapping.items()}
 
 
 def list_extras():
     """List extras: available, installed, required (by active stages), missing, extraneous."""
-    available_map = get_available_features()
+    available_map = _available_features()
     available = sorted(available_map.keys())
-    installed = get_installed_optional_dependencies()
+    installed = _installed_features()
     required_map = _gather_required_features_with_stages()
     required = sorted(required_map.keys())
 
@@ -51,46 +101,36 @@ def list_extras():
     missing = sorted(list(required_set - installed_set))
     extraneous = sorted(list(installed_set - required_set))
 
-    typer.echo("Available extras:")
+    out: list[str] = ["Available extras:"]
     if available:
-        origin_map = get_feature_origin_map()
+        origin_map = _feature_origin_map()
         rows = [(f, origin_map.get(f, 'custom')) for f in available]
         name_w = max(len(r[0]) for r in rows)
         origin_w = max(len(r[1]) for r in rows)
-        for name, origin in rows:
-            typer.echo(f"  {name.ljust(name_w)}  {origin.ljust(origin_w)}")
+        out.extend(f"  {n:<{name_w}}  {o:<{origin_w}}" for n, o in rows)
     else:
-        typer.echo("  (none)")
+        out.append("  (none)")
 
-    typer.echo("\nInstalled extras:")
-    if installed:
-        for f in installed:
-            typer.echo(f"  {f}")
-    else:
-        typer.echo("  (none)")
+    out.append("\nInstalled extras:")
+    out.extend([f"  {f}" for f in installed] or ["  (none)"])
 
-    typer.echo("\nRequired by active stages:")
+    out.append("\nRequired by active stages:")
     if required:
         for f in required:
             stages = required_map.get(f, [])
             suffix = f" ({', '.join(stages)})" if stages else ""
-            typer.echo(f"  {f}{suffix}")
+            out.append(f"  {f}{suffix}")
     else:
-        typer.echo("  (none)")
+        out.append("  (none)")
 
-    typer.echo("\nMissing extras:")
-    if missing:
-        for f in missing:
-            typer.echo(f"  {f}")
-    else:
-        typer.echo("  (none)")
+    out.append("\nMissing extras:")
+    out.extend([f"  {f}" for f in missing] or ["  (none)"])
 
-    typer.echo("\nExtraneous extras (installed but not required):")
-    if extraneous:
-        for f in extraneous:
-            typer.echo(f"  {f}")
-    else:
-        typer.echo("  (none)")
+    out.append("\nExtraneous extras (installed but not required):")
+    out.extend([f"  {f}" for f in extraneous] or ["  (none)"])
+
+    # One write for the whole report instead of one per line
+    typer.echo("\n".join(out))
 
 
 app.command("list")(list_extras)
@@ -101,10 +141,9 @@ def install_extras(
     features: List[str] = typer.Argument(None, help="Extras to install; if omitted installs missing"),
 ):
     """Install missing extras via pip. Package extras via idflow[...], project-defined extras as package lists."""
-    import subprocess, sys
-    available_map = get_available_features()
-    installed = set(get_installed_optional_dependencies())
-    origin_map = get_feature_origin_map()
+    available_map = _available_features()
+    installed = set(_installed_features())
+    origin_map = _feature_origin_map()
     if not features:
         # Default: install only missing required extras (from active stages)
         required = set(_gather_required_features_with_stages().keys())
@@ -114,103 +153,57 @@ def install_extras(
         typer.echo("Nothing to install")
         return
 
-    extras = [f for f in to_install if origin_map.get(f) == 'extra']
-    project_feats = [f for f in to_install if origin_map.get(f) != 'extra']
+    extras: list[str] = []
+    project_feats: list[str] = []
+    for f in to_install:
+        (extras if origin_map.get(f) == 'extra' else project_feats).append(f)
 
-    # 1) Install package extras in one pip command via idflow[...]
+    # Package extras via idflow[...], project-defined extras as flattened
+    # package lists; one pip run so the resolver sees everything at once
+    args: list[str] = []
     if extras:
-        cmd = [sys.executable, "-m", "pip", "install", f"idflow[{','.join(extras)}]"]
-        typer.echo("Running: " + " ".join(cmd))
-        subprocess.run(cmd, check=False)
+        args.append(f"idflow[{','.join(extras)}]")
+    for f in project_feats:
+        args.extend(available_map.get(f, []))
+    if not args:
+        return
 
-    # 2) Install project-defined extras directly (flattened packages)
-    if project_feats:
-        pkgs: list[str] = []
-        for f in project_feats:
-            pkgs.extend(available_map.get(f, []))
-        if pkgs:
-            cmd = [sys.executable, "-m", "pip", "install", *pkgs]
-            typer.echo("Running: " + " ".join(cmd))
-            subprocess.run(cmd, check=False)
+    cmd = [sys.executable, "-m", "pip", "install", *args]
+    typer.echo("Running: " + " ".join(cmd))
+    subprocess.run(cmd, check=False)
+
+    # The set of installed extras has changed now
+    _installed_features.cache_clear()
 
 
 @app.command("purge")
 def purge_extras():
     """Show uninstall suggestions for extraneous extras (manual confirmation)."""
-    import subprocess, sys
-    import importlib.metadata
-    import re
-    available_map = get_available_features()
-    installed = set(get_installed_optional_dependencies())
+    available_map = _available_features()
+    installed = set(_installed_features())
     required = set(_gather_required_features_with_stages().keys())
     extraneous = sorted(list(installed - required))
     if not extraneous:
         typer.echo("No extraneous extras installed")
         return
-    # Helper to extract base distribution name from requirement spec
-    def _extract_name(req: str) -> str:
-        name = req.split(";", 1)[0].split("[", 1)[0]
-        for sep in ["==", ">=", "<=", "~=", ">", "<", "!=", "==="]:
-            if sep in name:
-                name = name.split(sep, 1)[0]
-        return name.strip()
-
-    # Collect distributions that must be kept because they are required by active extras
-    protected_dists = set()
-    for f in required:
-        for req in available_map.get(f, []):
-            protected_dists.add(_extract_name(req))
-
-    # Also protect base (non-extra) runtime dependencies of idflow itself
+    # Resolve each extra's distribution names once
+    feature_to_dists = {
+        f: frozenset(_extract_name(req) for req in reqs)
+        for f, reqs in available_map.items()
+    }
+    required_packages = set().union(*(feature_to_dists.get(f, ()) for f in required))
+    extraneous_packages = set().union(*(feature_to_dists.get(f, ()) for f in extraneous))
+
+    # We cannot reliably uninstall extras as a group; suggest uninstalling their dists,
+    # but keep any distribution that is still required by an active extra ...
+    dists = extraneous_packages - required_packages
+    # ... or is a base (non-extra) runtime dependency of idflow itself
     try:
-        dist = importlib.metadata.distribution("idflow")
-        lines = dist.metadata.as_string().splitlines()
-        req_re = re.compile(r"^Requires-Dist:\s*([^;\s]+)(?:;\s*(.*))?$")
-        for line in lines:
-            if not line.startswith("Requires-Dist:"):
-                continue
-            m = req_re.match(line)
-            if not m:
-                continue
-            requirement = m.group(1)
-            marker = m.group(2) or ""
-            # Skip entries that are only for extras (we only want base deps)
-            if "extra ==" in marker:
-                continue
-            protected_dists.add(_extract_name(requirement))
+        dists -= _idflow_base_requires()
     except Exception:
         # Best-effort; if metadata isn't available, we just skip base protection
         pass
 
-    # We cannot reliably uninstall extras as a group; suggest uninstalling their dists,
-    # but exclude any distribution that is still required by protected sets.
-    # However, if a package is ONLY used by extraneous extras, it should be uninstallable.
-
-    # Find packages that are only used by extraneous extras
-    extraneous_packages = set()
-    required_packages = set()
-
-    # Collect packages from extraneous extras
-    for f in extraneous:
-        for req in available_map.get(f, []):
-            extraneous_packages.add(_extract_name(req))
-
-    # Collect packages from required extras
-    for f in required:
-        for req in available_map.get(f, []):
-            required_packages.add(_extract_name(req))
-
-    dists = set()
-    for f in extraneous:
-        for req in available_map.get(f, []):
-            name = _extract_name(req)
-            # Allow uninstall if package is only used by extraneous extras
-            if name not in required_packages and name not in protected_dists:
-                dists.add(name)
-            elif name in extraneous_packages and name not in required_packages:
-                # Package is only in extraneous extras, allow uninstall even if "protected"
-                dists.add(name)
-
     if not dists:
         typer.echo("No uninstallable distributions found for extraneous extras")
         return
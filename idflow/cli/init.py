@@ -2,15 +2,69 @@
 Initialize a new ID Flow project with virtual environment setup.
 """
 from __future__ import annotations
+import itertools
 import os
+import re
 import sys
 import subprocess
 from pathlib import Path
 from typing import Optional
 import shutil
+import venv
 import importlib.resources as ir
 import typer
 
+_IS_WIN = sys.platform == "win32"
+_VENV_BIN_DIR = "Scripts" if _IS_WIN else "bin"
+_PYTHON_EXE_NAME = "python.exe" if _IS_WIN else "python"
+# Shell command activating a venv, formatted with the venv directory name
+_ACTIVATE_CMD = "{}\\Scripts\\activate" if _IS_WIN else "source {}/bin/activate"
+
+# Template files that may contain __PROJECT_NAME__/__VENV_NAME__ placeholders
+_TEMPLATED_FILES = (
+    "pyproject.toml",
+    "README.md",
+    ".env",
+    ".env.bat",
+    "config/idflow.yml",
+)
+_PLACEHOLDER_RE = re.compile("__PROJECT_NAME__|__VENV_NAME__")
+_PLACEHOLDER_BYTES = (b"__PROJECT_NAME__", b"__VENV_NAME__")
+
+# Document status directories created in every new project
+_DATA_LAYOUT = ("data/inbox", "data/active", "data/done")
+
+# A `name = "idflow"` line near the top of a pyproject.toml
+_IDFLOW_NAME_RE = re.compile(rb"""(?m)^\s*name\s*=\s*["']idflow["']""")
+
+def _idflow_checkout_at(parent: Path) -> Optional[Path]:
+    """Return ``parent`` if its pyproject.toml declares the idflow project."""
+    import tomllib
+    pyproject_file = parent / "pyproject.toml"
+    try:
+        with open(pyproject_file, "rb") as fp:
+            head = fp.read(8192)
+            # Cheap reject before a full parse; only a candidate is parsed
+            if not _IDFLOW_NAME_RE.search(head):
+                return None
+            fp.seek(0)
+            data = tomllib.load(fp)
+    except (OSError, tomllib.TOMLDecodeError):
+        return None
+    project = data.get("project")
+    if not isinstance(project, dict) or project.get("name") != "idflow":
+        return None
+    # Verify it's actually an idflow project by checking for idflow/ directory
+    if (parent / "idflow" / "__init__.py").is_file():
+        return parent
+    return None
+
+
+def _is_current_interpreter(python: str) -> bool:
+    """Whether the ``--python`` executable is the interpreter running idflow."""
+    exe = shutil.which(python)
+    return exe is not None and os.path.realpath(exe) == os.path.realpath(sys.executable)
+
 
 def _detect_local_idflow(target_dir: Path) -> Optional[Path]:
     """
@@ -22,21 +76,23 @@ def _detect_local_idflow(target_dir: Path) -> Optional[Path]:
     Returns the path to the local idflow project if found, None otherwise.
     """
     current_path = target_dir.resolve()
+    home = Path.home()
 
     # Walk up the directory tree looking for idflow project
     for parent in [current_path] + list(current_path.parents):
+        # A development checkout is never the home directory itself, an
+        # ancestor of it, or an interpreter's site-packages
+        if parent == home or parent.name == "site-packages":
+            break
+
         # Check for pyproject.toml with idflow package
-        pyproject_file = parent / "pyproject.toml"
-        if pyproject_file.exists():
-            try:
-                content = pyproject_file.read_text()
-                if 'name = "idflow"' in content or 'name="idflow"' in content:
-                    # Verify it's actually an idflow project by checking for idflow/ directory
-                    idflow_dir = parent / "idflow"
-                    if idflow_dir.exists() and (idflow_dir / "__init__.py").exists():
-                        return parent
-            except Exception:
-                continue
+        found = _idflow_checkout_at(parent)
+        if found is not None:
+            return found
+
+        # A repository root bounds the checkout we could be inside
+        if (parent / ".git").exists():
+            break
 
         # # Check for setup.py with idflow package
         # setup_file = parent / "setup.py"
@@ -63,6 +119,22 @@ def _detect_local_idflow(target_dir: Path) -> Optional[Path]:
     return None
 
 
+def _copy_missing_files(src_dir: Path, dest_dir: Path) -> None:
+    """Copy a template tree into ``dest_dir``, skipping files that already exist.
+
+    Lists each destination directory once instead of stat'ing every file.
+    Directories are created with ``mkdir`` and keep their own permissions.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    existing = set(os.listdir(dest_dir))
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                _copy_missing_files(Path(entry.path), dest_dir / entry.name)
+            elif entry.name not in existing:
+                shutil.copy2(entry.path, dest_dir / entry.name)
+
+
 def _handle_project_launch(project_name: Optional[str], target_dir: Path, venv_name: str, launch_project: Optional[bool]):
     """
     Handle project launching after successful initialization.
@@ -93,10 +165,7 @@ def _handle_project_launch(project_name: Optional[str], target_dir: Path, venv_n
     change_directory = project_name is not None and should_launch
 
     # Generate activation commands
-    if sys.platform == "win32":
-        activate_cmd = f"{venv_name}\\Scripts\\activate"
-    else:
-        activate_cmd = f"source {venv_name}/bin/activate"
+    activate_cmd = _ACTIVATE_CMD.format(venv_name)
 
     if should_launch:
         typer.echo("\n" + "="*50)
@@ -113,7 +182,7 @@ def _handle_project_launch(project_name: Optional[str], target_dir: Path, venv_n
 
         # Launch an interactive subshell inside the project with venv activated
         try:
-            if sys.platform == "win32":
+            if _IS_WIN:
                 # Replace current process with cmd.exe session
                 cmd_exe = os.environ.get("COMSPEC", "cmd.exe")
                 cmd = f"cd /d \"{str(target_dir)}\" && call \"{venv_name}\\\\Scripts\\\\activate.bat\" && title idflow:{project_name or target_dir.name}"
@@ -122,7 +191,7 @@ def _handle_project_launch(project_name: Optional[str], target_dir: Path, venv_n
             else:
                 shell = os.environ.get("SHELL", "/bin/bash")
                 venv_dir = (target_dir / venv_name).resolve()
-                venv_bin = (venv_dir / "bin").resolve()
+                venv_bin = (venv_dir / _VENV_BIN_DIR).resolve()
                 # Prepare environment for the new shell
                 env = os.environ.copy()
                 env["VIRTUAL_ENV"] = str(venv_dir)
@@ -159,7 +228,10 @@ def init_project(
     python: str = typer.Option("python3", "--python", help="Python executable to use"),
     venv_name: str = typer.Option(".venv", "--venv", help="Virtual environment directory name"),
     add_extra: list[str] = typer.Option([], "--add-extra", help="Add extra to install (can be used multiple times)"),
-    launch_project: Optional[bool] = typer.Option(None, "--launch-project/--no-launch-project", help="Whether to launch the project after initialization (prompt if not specified)")
+    launch_project: Optional[bool] = typer.Option(None, "--launch-project/--no-launch-project", help="Whether to launch the project after initialization (prompt if not specified)"),
+    upgrade_pip: bool = typer.Option(False, "--upgrade-pip", help="Upgrade pip in the virtual environment before installing idflow"),
+    use_uv: bool = typer.Option(False, "--use-uv", help="Create the virtual environment and install with uv if it is available"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Show installer output while installing idflow")
 ):
     """
     Initialize a new ID Flow project.
@@ -169,6 +241,10 @@ def init_project(
     """
     current_dir = Path.cwd()
 
+    uv_exe = shutil.which("uv") if use_uv else None
+    if use_uv and not uv_exe:
+        typer.echo("uv not found on PATH, falling back to venv and pip")
+
     if project_name:
         # Create new project directory
         project_dir = current_dir / project_name
@@ -187,9 +263,12 @@ def init_project(
         typer.echo(f"Initializing project in current directory: {target_dir}")
 
     # Check if we're in an empty directory (except for .venv)
-    existing_files = [f for f in target_dir.iterdir() if f.name != venv_name]
+    # A few names are enough for the error message
+    with os.scandir(target_dir) as it:
+        existing_files = list(itertools.islice((e.name for e in it if e.name != venv_name), 10))
     if existing_files:
-        typer.echo(f"Error: You're not in an empty directory. Found: {[f.name for f in existing_files]}")
+        more = ", ..." if len(existing_files) == 10 else ""
+        typer.echo(f"Error: You're not in an empty directory. Found: {', '.join(existing_files)}{more}")
         typer.echo("Please run 'idflow init' in an empty directory or use 'idflow init <project_name>' to create a new project.")
         raise typer.Exit(1)
 
@@ -197,12 +276,10 @@ def init_project(
     venv_path = target_dir / venv_name
 
     # Check if it's a valid virtual environment
-    if sys.platform == "win32":
-        python_exe = venv_path / "Scripts" / "python.exe"
-    else:
-        python_exe = venv_path / "bin" / "python"
+    python_exe = venv_path / _VENV_BIN_DIR / _PYTHON_EXE_NAME
 
-    if venv_path.exists() and python_exe.exists():
+    # One stat: the interpreter can only exist inside an existing venv
+    if os.path.isfile(python_exe):
         typer.echo(f"Using existing virtual environment: {venv_path}")
     else:
         if venv_path.exists():
@@ -211,7 +288,14 @@ def init_project(
 
         typer.echo(f"Creating virtual environment: {venv_path}")
         try:
-            subprocess.run([python, "-m", "venv", str(venv_path)], check=True)
+            if uv_exe:
+                # --seed keeps pip available inside the venv for `idflow extras`
+                subprocess.run([uv_exe, "venv", "--seed", "--python", python, str(venv_path)], check=True)
+            elif _is_current_interpreter(python):
+                # Same interpreter as ours: build the venv in-process
+                venv.EnvBuilder(with_pip=True).create(str(venv_path))
+            else:
+                subprocess.run([python, "-m", "venv", str(venv_path)], check=True)
         except subprocess.CalledProcessError as e:
             typer.echo(f"Error creating virtual environment: {e}")
             raise typer.Exit(1)
@@ -219,22 +303,9 @@ def init_project(
             typer.echo(f"Error: Python executable '{python}' not found")
             raise typer.Exit(1)
 
-    # Determine activation script path
-    if sys.platform == "win32":
-        activate_script = venv_path / "Scripts" / "activate.bat"
-        pip_exe = venv_path / "Scripts" / "pip.exe"
-        python_exe = venv_path / "Scripts" / "python.exe"
-    else:
-        activate_script = venv_path / "bin" / "activate"
-        pip_exe = venv_path / "bin" / "pip"
-        python_exe = venv_path / "bin" / "python"
-
     # Install idflow in virtual environment
     typer.echo("Installing idflow in virtual environment...")
     try:
-        # Upgrade pip first
-        subprocess.run([str(python_exe), "-m", "pip", "install", "--upgrade", "pip"], check=True)
-
         # Check if we're in a development environment (local idflow project)
         local_idflow_path = _detect_local_idflow(target_dir)
 
@@ -247,21 +318,35 @@ def init_project(
                 # For local development, we can't use extras syntax
                 typer.echo(f"   Note: Extras {', '.join(add_extra)} will be available from local installation")
 
-            install_cmd = [str(pip_exe), "install", "-e", str(local_idflow_path)]
+            install_args = ["-e", str(local_idflow_path)]
         else:
             # Use PyPI installation
             if add_extra:
                 # Create extras string like "research,writer"
                 extras_str = ",".join(add_extra)
-                install_cmd = [str(pip_exe), "install", f"idflow[{extras_str}]"]
+                install_args = [f"idflow[{extras_str}]"]
                 typer.echo(f"Installing idflow with extras: {', '.join(add_extra)}")
             else:
-                install_cmd = [str(pip_exe), "install", "idflow"]
+                install_args = ["idflow"]
                 typer.echo("Installing idflow (base)")
 
-        subprocess.run(install_cmd, check=True)
+        # One pip run; venv already seeds a recent pip, so it is only
+        # upgraded (in the same resolve) on request
+        if uv_exe:
+            install_cmd = [uv_exe, "pip", "install", "--python", str(python_exe)]
+        else:
+            install_cmd = [str(python_exe), "-m", "pip", "install"]
+        if upgrade_pip:
+            install_cmd += ["--upgrade", "pip"]
+        # Installer output is only shown on failure unless --verbose is given;
+        # pip's own version check would be another index round trip
+        pip_env = {**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1", "PIP_NO_INPUT": "1"}
+        subprocess.run(install_cmd + install_args, check=True, env=pip_env,
+                       capture_output=not verbose, text=True)
         typer.echo("✅ idflow installed successfully")
     except subprocess.CalledProcessError as e:
+        if e.stdout or e.stderr:
+            typer.echo((e.stdout or "") + (e.stderr or ""), err=True)
         typer.echo(f"Error installing idflow: {e}")
         raise typer.Exit(1)
 
@@ -273,15 +358,7 @@ def init_project(
         # materialize resource to filesystem if needed and copy recursively
         with ir.as_file(template_root) as src_path:
             # Copy without overwriting existing files
-            for root, dirs, files in os.walk(src_path):
-                rel = Path(root).relative_to(src_path)
-                dest_dir = target_dir / rel
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                for name in files:
-                    src_file = Path(root) / name
-                    dest_file = dest_dir / name
-                    if not dest_file.exists():
-                        shutil.copy2(src_file, dest_file)
+            _copy_missing_files(Path(src_path), target_dir)
     except Exception as e:
         typer.echo(f"Error copying project template: {e}")
         raise typer.Exit(1)
@@ -293,37 +370,27 @@ def init_project(
         "__VENV_NAME__": venv_name,
     }
 
-    for rel in [
-        "pyproject.toml",
-        "README.md",
-        ".env",
-        ".env.bat",
-        "config/idflow.yml",
-    ]:
+    for rel in _TEMPLATED_FILES:
         fpath = target_dir / rel
-        if fpath.exists():
-            try:
-                content = fpath.read_text()
-                for k, v in replacements.items():
-                    content = content.replace(k, v)
-                fpath.write_text(content)
-            except Exception:
-                # Best-effort; continue without failing the init
-                pass
+        try:
+            # A missing file lands in the except below, saving a stat
+            data = fpath.read_bytes()
+            if any(k in data for k in _PLACEHOLDER_BYTES):
+                content = _PLACEHOLDER_RE.sub(lambda m: replacements[m.group(0)], data.decode("utf-8"))
+                fpath.write_text(content, encoding="utf-8")
+        except Exception:
+            # Best-effort; continue without failing the init
+            pass
 
     # Ensure data directories exist (template also contains .gitkeep)
-    (target_dir / "data" / "inbox").mkdir(parents=True, exist_ok=True)
-    (target_dir / "data" / "active").mkdir(parents=True, exist_ok=True)
-    (target_dir / "data" / "done").mkdir(parents=True, exist_ok=True)
+    for rel in _DATA_LAYOUT:
+        os.makedirs(os.path.join(target_dir, rel), exist_ok=True)
 
     # Success message
     typer.echo("\n🎉 Project initialized successfully!")
     typer.echo(f"\nNext steps:")
     typer.echo(f"- Activate the virtual environment:")
-    if sys.platform == "win32":
-        typer.echo(f"   {venv_name}\\Scripts\\activate")
-    else:
-        typer.echo(f"   source {venv_name}/bin/activate")
+    typer.echo(f"   {_ACTIVATE_CMD.format(venv_name)}")
 
     typer.echo(f"   Or use: source .env")
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import typer
 from typing import Optional, List
-from idflow.core.document_factory import get_document_class
 
 
 def evaluate(
@@ -9,6 +10,7 @@ def evaluate(
     stage: Optional[str] = typer.Option(None, "--stage", help="Specific stage name to evaluate"),
     uuid: Optional[str] = typer.Option(None, "--uuid", help="Specific document UUID to evaluate"),
     allow_rerun: bool = typer.Option(False, "--allow-rerun", help="Allow rerunning completed stages with multiple_callable: true"),
+    jobs: int = typer.Option(1, "--jobs", envvar="IDFLOW_EVAL_WORKERS", help="Number of documents evaluated concurrently (default 1: serially)"),
 ):
     """
     Evaluate stage requirements for documents and automatically start stages where requirements are met.
@@ -16,6 +18,10 @@ def evaluate(
     Without parameters: Evaluates all documents in inbox status against all configured stages.
     With filters: Only evaluates specific documents and/or stages.
     """
+    from idflow.core.document_factory import get_document_class
+    from idflow.core.stage_definitions import get_stage_definitions
+    from idflow.core.workflow_manager import get_workflow_manager
+
     # Get document class from factory
     DocumentClass = get_document_class()
 
@@ -26,52 +32,81 @@ def evaluate(
         if not doc:
             typer.echo(f"Document with UUID {uuid} not found", err=True)
             raise typer.Exit(1)
-        documents = [doc]
+        documents = iter([doc])
     else:
-        # All documents with specified status
-        documents = DocumentClass.where(status=status)
-
-    if not documents:
-        typer.echo(f"No documents found with status '{status}'", err=True)
-        raise typer.Exit(1)
+        # All documents with specified status, loaded as they are evaluated
+        documents = DocumentClass.iter_where(status=status)
 
     # Track overall results
-    total_documents = len(documents)
+    total_documents = 0
     total_evaluated = 0
     total_started = 0
     total_skipped = 0
 
-    typer.echo(f"Evaluating {total_documents} documents...")
+    # Evaluations are independent and mostly wait on Conductor, so they run
+    # in threads; reporting and saving stay on this thread. Build the stage
+    # definitions and workflow manager singletons first so the threads
+    # don't race to create them.
+    get_stage_definitions()
+    get_workflow_manager()
+    jobs = max(1, jobs)
 
-    for doc in documents:
-        typer.echo(f"\nDocument {doc.id} (status: {doc.status}):")
+    def evaluate_doc(doc):
+        status_before = doc.status
+        return status_before, doc.evaluate_stages(stage_name=stage, allow_rerun=allow_rerun)
 
-        # Use document's evaluate_stages method
-        result = doc.evaluate_stages(stage_name=stage, allow_rerun=allow_rerun)
+    def report(doc, future):
+        nonlocal total_evaluated, total_started, total_skipped
+        status_before, result = future.result()
+        lines = [f"\nDocument {doc.id} (status: {status_before}):"]
 
         if not result["success"]:
+            typer.echo(lines[0])
             typer.echo(f"  ERROR: {result.get('error', 'Unknown error')}", err=True)
-            continue
+            return
 
         # Display results for this document
         for started_stage in result["started_stages"]:
             workflows_info = f" - {started_stage['workflows_triggered']} workflows triggered" if started_stage['workflows_triggered'] > 0 else " - no workflows triggered"
-            typer.echo(f"  {started_stage['name']}: STARTED - requirements met (stage ID: {started_stage['id']}){workflows_info}")
+            lines.append(f"  {started_stage['name']}: STARTED - requirements met (stage ID: {started_stage['id']}){workflows_info}")
 
         for skipped_stage in result["skipped_stages"]:
-            typer.echo(f"  {skipped_stage['name']}: SKIPPED - {skipped_stage['reason']}")
+            lines.append(f"  {skipped_stage['name']}: SKIPPED - {skipped_stage['reason']}")
 
         # Show status change if it occurred
         if result["status_changed"]:
-            typer.echo(f"  Document status changed: inbox → active (has {len(doc.stages)} stage(s))")
+            lines.append(f"  Document status changed: inbox → active (has {len(doc.stages)} stage(s))")
+
+        # One write per document
+        typer.echo("\n".join(lines))
 
         # Update totals
         total_evaluated += result["stages_evaluated"]
         total_started += result["stages_started"]
         total_skipped += result["stages_skipped"]
 
-        # Save document after evaluation
-        doc.save()
+        # Only write documents the evaluation actually changed
+        if result["status_changed"] or result["stages_started"] > 0:
+            doc.save()
+
+    # Keep at most `jobs` documents in flight so documents are read as the
+    # evaluation progresses; reporting in submission order keeps the output
+    # in document order
+    pending: deque = deque()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for doc in documents:
+            if total_documents == 0:
+                typer.echo("Evaluating documents...")
+            total_documents += 1
+            pending.append((doc, executor.submit(evaluate_doc, doc)))
+            if len(pending) >= jobs:
+                report(*pending.popleft())
+        while pending:
+            report(*pending.popleft())
+
+    if not total_documents:
+        typer.echo(f"No documents found with status '{status}'", err=True)
+        raise typer.Exit(1)
 
     # Summary
     typer.echo(f"\nSummary:")
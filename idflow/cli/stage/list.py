@@ -3,23 +3,37 @@ from __future__ import annotations
 import typer
 from pathlib import Path
 from typing import Dict, Optional
-from idflow.core.resource_resolver import ResourceResolver
-import yaml
+
+from ..common import row_formatter
 
 
 def _read_yaml(path: Path) -> Optional[Dict]:
+    import yaml
+    # libyaml-backed loader when PyYAML was built with it
+    loader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=loader)
             return data if isinstance(data, dict) else None
     except Exception:
         return None
 
 def list_stages():
     """List available stages with status and origin classification."""
+    from idflow.core.resource_resolver import ResourceResolver
+
     # Discover stages via ResourceResolver composite (overlay + classifier)
     rr = ResourceResolver()
-    name_extractor = rr.name_from_yaml_key("name")
+
+    # Parse each stage file once: the name extractor keeps the parsed data,
+    # which also provides the effective files' 'active' flag below
+    parsed: Dict[Path, Optional[Dict]] = {}
+
+    def name_extractor(path: Path) -> Optional[str]:
+        data = parsed[path] = _read_yaml(path)
+        name = data.get("name") if data else None
+        return str(name) if name is not None else None
+
     flat_by_name, classify = rr.build_index_with_classifier(
         subdir="stages",
         pattern="*.yml",
@@ -33,19 +47,18 @@ def list_stages():
 
     # Build rows: use effective file from overlay index to read 'active'
     rows = []
+    name_w = status_w = origin_w = 0
     for name in sorted(flat_by_name.keys()):
-        yml_path = flat_by_name[name]
-        data = _read_yaml(yml_path) or {}
+        data = parsed.get(flat_by_name[name]) or {}
         active = bool(data.get("active", True))
         status_label = "active" if active else "inactive"
         origin, origin_tag = classify(name)
         rows.append((name, status_label, origin, origin_tag))
+        # Track column widths while building rows for the aligned output
+        name_w = max(name_w, len(name))
+        status_w = max(status_w, len(status_label))
+        origin_w = max(origin_w, len(origin))
 
-    # Aligned table-like output
-    name_w = max(len(r[0]) for r in rows)
-    status_w = max(len(r[1]) for r in rows)
-    origin_w = max(len(r[2]) for r in rows)
-
-    for name, status_label, origin, _tag in rows:
-        typer.echo(f"{name.ljust(name_w)}  {status_label.ljust(status_w)}  {origin.ljust(origin_w)}")
+    fmt = row_formatter(name_w, status_w, origin_w)
+    typer.echo("\n".join(fmt(name, status_label, origin) for name, status_label, origin, _tag in rows))
 
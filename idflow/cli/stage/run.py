@@ -1,8 +1,6 @@
 from __future__ import annotations
 import typer
 from typing import Optional
-from idflow.core.fs_markdown import FSMarkdownDocument
-from idflow.core.stage_definitions import get_stage_definitions
 
 
 def run(
@@ -11,6 +9,8 @@ def run(
     workflow_name: Optional[str] = typer.Argument(None, help="Optional specific workflow to run"),
 ):
     """Manually start a stage for a document."""
+    from idflow.core.fs_markdown import FSMarkdownDocument
+    from idflow.core.stage_definitions import get_stage_definitions
 
     # Load the document
     doc = FSMarkdownDocument.find(doc_uuid)
@@ -28,10 +28,9 @@ def run(
 
     # Check if workflow is specified and exists in stage definition
     if workflow_name:
-        workflow_found = any(wf.name == workflow_name for wf in stage_definition.workflows)
-        if not workflow_found:
+        available_workflows = [wf.name for wf in stage_definition.workflows]
+        if workflow_name not in available_workflows:
             typer.echo(f"Workflow '{workflow_name}' not found in stage '{stage_name}'", err=True)
-            available_workflows = [wf.name for wf in stage_definition.workflows]
             typer.echo(f"Available workflows: {', '.join(available_workflows)}", err=True)
             raise typer.Exit(1)
 
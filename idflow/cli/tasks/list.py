@@ -1,7 +1,8 @@
 from __future__ import annotations
 import typer
-from idflow.core.workflow_manager import get_workflow_manager
-from idflow.core.resource_resolver import ResourceResolver
+
+from ..common import row_formatter
+
 
 def list_tasks(
     local: bool = typer.Option(False, "--local", help="Show only local task files"),
@@ -10,6 +11,9 @@ def list_tasks(
     sync: bool = typer.Option(False, "--sync", help="Show synchronization status")
 ):
     """List tasks (local files and/or Conductor)."""
+    from idflow.core.workflow_manager import get_workflow_manager
+    from idflow.core.resource_resolver import ResourceResolver
+
     workflow_manager = get_workflow_manager()
 
     if sync:
@@ -50,44 +54,44 @@ def list_tasks(
 
         # Use ResourceResolver for consistent task discovery and classification
         resolver = ResourceResolver()
-        required = set(workflow_manager.required_task_names())
+        required = frozenset(workflow_manager.required_task_names())
 
         # Get task names and origins using same logic as vendor list
         lib_t, vend_t, proj_t = resolver.names_by_base("tasks", "*", name_extractor=None, item_type="dir")
-        task_names = sorted(set().union(lib_t, vend_t, proj_t))
+        task_names = sorted({*lib_t, *vend_t, *proj_t})
 
         if not task_names:
             typer.echo("  No task files found")
         else:
             # Build rows for tabular display
             rows = []
+            name_w = status_w = origin_w = 0
             for name in task_names:
                 origin, short = resolver.classify_origin_from_sets(name, lib_t, vend_t, proj_t)
                 status = "active" if name in required else "inactive"
                 rows.append((name, status, origin))
-
-            # Calculate column widths
-            name_w = max(len(r[0]) for r in rows)
-            status_w = max(len(r[1]) for r in rows)
-            origin_w = max(len(r[2]) for r in rows)
-
-            for name, status, origin in rows:
-                status_color = "green" if status == "active" else "red"
-                # Apply color but keep original length for padding
-                styled_status = typer.style(status, fg=status_color)
-                typer.echo(f"  {name.ljust(name_w)}  {styled_status}{' ' * (status_w - len(status))}  {origin.ljust(origin_w)}")
+                # Calculate column widths in the same pass
+                name_w = max(name_w, len(name))
+                status_w = max(status_w, len(status))
+                origin_w = max(origin_w, len(origin))
+
+            # Style each status label once; pad by the plain length so colors don't skew alignment
+            styled = {
+                status: typer.style(status, fg="green" if status == "active" else "red")
+                + " " * (status_w - len(status))
+                for status in ("active", "inactive")
+            }
+            fmt = row_formatter(name_w, None, origin_w, indent="  ")
+            typer.echo("\n".join(fmt(name, styled[status], origin) for name, status, origin in rows))
 
         if remote or all:
             typer.echo()
 
     if remote or all:
         typer.echo("Tasks in Conductor:")
-        remote_tasks = workflow_manager.list_tasks_remote()
+        remote_names = [task['name'] for task in workflow_manager.list_tasks_remote() if task.get('name')]
 
-        if not remote_tasks:
+        if not remote_names:
             typer.echo("  No tasks found in Conductor")
         else:
-            for task in remote_tasks:
-                name = task.get('name')
-                if name:
-                    typer.echo(f"  {name}")
+            typer.echo("\n".join(f"  {name}" for name in remote_names))
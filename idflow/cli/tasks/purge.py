@@ -1,6 +1,5 @@
 from __future__ import annotations
 import typer
-from idflow.core.workflow_manager import get_workflow_manager
 
 def purge_tasks(
     task_name: str = typer.Argument(None, help="Specific task name to purge (optional)"),
@@ -9,6 +8,8 @@ def purge_tasks(
     confirm: bool = typer.Option(False, "-y", help="Skip confirmation prompt")
 ):
     """Purge tasks from Conductor."""
+    from idflow.core.workflow_manager import get_workflow_manager
+
     workflow_manager = get_workflow_manager()
 
     if task_name:
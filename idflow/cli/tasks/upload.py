@@ -1,6 +1,5 @@
 from __future__ import annotations
 import typer
-from idflow.core.workflow_manager import get_workflow_manager
 
 def upload_tasks(
     task_name: str = typer.Argument(None, help="Specific task name to upload (optional)"),
@@ -8,6 +7,8 @@ def upload_tasks(
     all: bool = typer.Option(False, "--all", help="Upload all tasks")
 ):
     """Upload tasks to Conductor."""
+    from idflow.core.workflow_manager import get_workflow_manager
+
     workflow_manager = get_workflow_manager()
 
     if task_name:
@@ -4,18 +4,178 @@ import sys
 import signal
 import time
 import os
+import re
 import subprocess
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import importlib.util
 
-from conductor.client.configuration.configuration import Configuration
-from conductor.client.worker.worker import Worker
-from conductor.client.automator.task_handler import TaskHandler
+# Matched against raw bytes so discovery doesn't decode every task file
+_TASK_NAME_RE = re.compile(rb"@worker_task\(task_definition_name='([^']+)'\)")
+# `idflow worker start` command lines, minus the inspection commands themselves
+_WORKER_COMMAND_RE = re.compile(r"^(?!.*worker (?:ps|killall|list)).*worker start")
+# Commands shown by `worker ps`: additionally not kernel workers, and run via
+# idflow, conductor or python
+_LISTED_WORKER_COMMAND_RE = re.compile(r"^(?!.*kworker)(?=.*(?i:idflow|conductor|python))")
+_WORKER_NAME_RE = re.compile(r"(?:--worker|\s-w)\s+(\w+)")
+
+
+class _ProcInfo(NamedTuple):
+    """A process as seen by one snapshot."""
+    ppid: int
+    command: str
+    # Clock ticks since boot; 0 when unknown (ps fallback)
+    starttime: int = 0
+    # Owner and the /proc stat fields after comm, for ps-style rows (/proc only)
+    uid: int = -1
+    stat: Tuple[bytes, ...] = ()
+
+
+_PROC_ROOT = "/proc"
+
+
+def _snapshot_procs() -> Dict[int, _ProcInfo]:
+    """Return ``pid -> _ProcInfo`` for all processes in one pass.
+
+    Reads /proc directly where available; elsewhere a single ``ps`` call
+    provides the same table. Callers classify many processes against one
+    snapshot instead of spawning ``ps`` per process.
+    """
+    try:
+        it = os.scandir(_PROC_ROOT)
+    except OSError:
+        return _snapshot_procs_ps()
+
+    procs: Dict[int, _ProcInfo] = {}
+    with it:
+        for entry in it:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"{entry.path}/stat", "rb") as f:
+                    stat = f.read()
+                with open(f"{entry.path}/cmdline", "rb") as f:
+                    cmdline = f.read()
+                uid = entry.stat().st_uid
+                pid, comm, fields = _split_stat(stat)
+                ppid, starttime = int(fields[1]), int(fields[19])
+            except (OSError, ValueError, IndexError):
+                # Process exited while scanning, or is not readable
+                continue
+            if cmdline:
+                command = cmdline.replace(b"\0", b" ").decode("utf-8", "replace").strip()
+            else:
+                # Kernel threads and zombies have no argv; ps shows them as [comm]
+                command = f"[{comm.decode('utf-8', 'replace')}]"
+            procs[pid] = _ProcInfo(ppid, command, starttime, uid, tuple(fields))
+    return procs
+
+
+def _split_stat(buf: bytes) -> Tuple[int, bytes, List[bytes]]:
+    """Split a ``/proc/<pid>/stat`` line into pid, comm and the remaining fields."""
+    # comm (field 2) may contain spaces and parentheses; it ends at the last ')'
+    rparen = buf.rfind(b")")
+    return int(buf[:buf.index(b" ")]), buf[buf.index(b"(") + 1:rparen], buf[rparen + 2:].split(b" ")
+
+
+def _parse_stat(buf: bytes) -> Tuple[int, int, int, int]:
+    """Parse a ``/proc/<pid>/stat`` line into ``(pid, ppid, starttime, rss_pages)``."""
+    pid, _, f = _split_stat(buf)
+    return pid, int(f[1]), int(f[19]), int(f[21])
+
+
+def _snapshot_procs_ps() -> Dict[int, _ProcInfo]:
+    """``_snapshot_procs`` for systems without /proc (one ``ps`` call)."""
+    procs: Dict[int, _ProcInfo] = {}
+    try:
+        result = subprocess.run(
+            ["ps", "-Ao", "pid=,ppid=,command="],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return procs
+    for line in result.stdout.splitlines():
+        parts = line.split(None, 2)
+        try:
+            procs[int(parts[0])] = _ProcInfo(int(parts[1]), parts[2] if len(parts) > 2 else "")
+        except (ValueError, IndexError):
+            continue
+    return procs
+
+
+class _ProcTable:
+    """One process snapshot plus a ppid -> children index built from it."""
+
+    def __init__(self, procs: Dict[int, _ProcInfo]):
+        self.procs = procs
+        self.children: Dict[int, List[int]] = defaultdict(list)
+        # Start order, with PIDs breaking ties and ordering the ps fallback
+        for pid in sorted(procs, key=lambda p: (procs[p].starttime, p)):
+            self.children[procs[pid].ppid].append(pid)
+
+    def children_of(self, pid: int) -> List[int]:
+        """Child PIDs of ``pid``, oldest first."""
+        return self.children.get(pid, [])
+
+
+# Set inside ``oneshot()``; the table itself is taken on first use
+_oneshot_active = False
+_oneshot_table: Optional[_ProcTable] = None
+
+
+@contextmanager
+def oneshot():
+    """Share one process snapshot between all lookups inside the block.
+
+    Mirrors ``psutil.Process.oneshot()``: the first lookup scans the process
+    table and later ones reuse it until the outermost block exits.
+    """
+    global _oneshot_active, _oneshot_table
+    if _oneshot_active:
+        yield
+        return
+    _oneshot_active = True
+    try:
+        yield
+    finally:
+        _oneshot_active = False
+        _oneshot_table = None
+
+
+def _process_table() -> _ProcTable:
+    """Return the ``oneshot()`` table, or a fresh snapshot outside one."""
+    global _oneshot_table
+    if _oneshot_table is not None:
+        return _oneshot_table
+    table = _ProcTable(_snapshot_procs())
+    if _oneshot_active:
+        _oneshot_table = table
+    return table
 
 
 def is_child_process(pid: int, parent_pid: int) -> bool:
     """Check if a process is a child of the parent process."""
+    if _oneshot_active:
+        info = _process_table().procs.get(pid)
+        return info is not None and info.ppid == parent_pid
+    try:
+        with open(f"{_PROC_ROOT}/{pid}/stat", "rb") as f:
+            return _parse_stat(f.read())[1] == parent_pid
+    except FileNotFoundError:
+        # Without /proc ask ps; with it, the process has already exited
+        if not os.path.isdir(_PROC_ROOT):
+            return _is_child_process_ps(pid, parent_pid)
+        return False
+    except (OSError, ValueError, IndexError):
+        return False
+
+
+def _is_child_process_ps(pid: int, parent_pid: int) -> bool:
+    """``is_child_process`` for systems without /proc."""
     try:
         # Get the parent process ID of the given process
         result = subprocess.run(
@@ -30,67 +190,168 @@ def is_child_process(pid: int, parent_pid: int) -> bool:
         return False
 
 
-def determine_process_type(current_pid: int, ppid: int, memory_usage: float) -> str:
+class _PsRow(NamedTuple):
+    """A worker process with the columns shown by worker ps and killall."""
+    user: str
+    pid: int
+    cpu: str
+    mem: str
+    vsz: str
+    rss: str
+    tty: str
+    stat: str
+    start: str
+    time: str
+    command: str
+
+
+def _worker_rows() -> Tuple[List[_PsRow], Optional[_ProcTable]]:
+    """Return rows for the ``worker start`` processes and their snapshot.
+
+    On systems with /proc the rows come from one process snapshot, which is
+    returned for hierarchy lookups on the same rows. Elsewhere they are
+    parsed from ``ps aux`` and no snapshot is returned. Raises
+    ``CalledProcessError`` or ``FileNotFoundError`` if ``ps`` fails.
+    """
+    if os.path.isdir(_PROC_ROOT):
+        table = _process_table()
+        try:
+            return _proc_worker_rows(table), table
+        except (OSError, ValueError, IndexError):
+            pass
+    result = subprocess.run(
+        ["ps", "aux"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return _parse_ps_aux(result.stdout), None
+
+
+def _proc_worker_rows(table: _ProcTable) -> List[_PsRow]:
+    """Rows for the worker processes in a /proc snapshot."""
+    matches = [(pid, info) for pid, info in sorted(table.procs.items())
+               if info.stat and _WORKER_COMMAND_RE.search(info.command)]
+    if not matches:
+        return []
+    clk_tck = os.sysconf("SC_CLK_TCK")
+    page_kb = os.sysconf("SC_PAGE_SIZE") // 1024
+    with open(f"{_PROC_ROOT}/uptime", "rb") as f:
+        uptime = float(f.read().split()[0])
+    with open(f"{_PROC_ROOT}/meminfo", "rb") as f:
+        # First line: "MemTotal:  <n> kB"
+        mem_total_kb = int(f.readline().split()[1])
+    now = time.time()
+
+    rows = []
+    for pid, info in matches:
+        f = info.stat
+        try:
+            # statm: size resident shared ... (in pages)
+            with open(f"{_PROC_ROOT}/{pid}/statm", "rb") as statm:
+                rss_kb = int(statm.read().split()[1]) * page_kb
+        except OSError:
+            # Exited since the snapshot
+            continue
+        cpu_ticks = int(f[11]) + int(f[12])
+        cpu_secs = cpu_ticks // clk_tck
+        elapsed = uptime - info.starttime / clk_tck
+        started = time.localtime(now - elapsed)
+        rows.append(_PsRow(
+            user=_user_name(info.uid),
+            pid=pid,
+            cpu=f"{100 * cpu_ticks / clk_tck / elapsed if elapsed > 0 else 0.0:.1f}",
+            mem=f"{100 * rss_kb / mem_total_kb:.1f}",
+            vsz=str(int(f[20]) // 1024),
+            rss=str(rss_kb),
+            tty=_tty_name(int(f[4])),
+            stat=f[0].decode(),
+            start=time.strftime("%H:%M" if elapsed < 24 * 3600 else "%b%d", started),
+            time=f"{cpu_secs // 60}:{cpu_secs % 60:02d}",
+            command=info.command,
+        ))
+    return rows
+
+
+def _parse_ps_aux(output: str) -> List[_PsRow]:
+    """Rows for the worker processes in ``ps aux`` output."""
+    rows = []
+    for line in output.splitlines():
+        # Capping the split keeps the command (11th field) intact
+        parts = line.split(None, 10)
+        if len(parts) == 11 and parts[1].isdigit() and _WORKER_COMMAND_RE.search(parts[10]):
+            rows.append(_PsRow(parts[0], int(parts[1]), *parts[2:]))
+    return rows
+
+
+def _user_name(uid: int) -> str:
+    import pwd
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def _tty_name(tty_nr: int) -> str:
+    """Controlling terminal from the stat ``tty_nr`` field, or '?'."""
+    major = (tty_nr >> 8) & 0xfff
+    minor = (tty_nr & 0xff) | ((tty_nr >> 12) & 0xfff00)
+    if 136 <= major <= 143:
+        return f"pts/{(major - 136) * 256 + minor}"
+    if major == 4:
+        return f"tty{minor}" if minor < 64 else f"ttyS{minor - 64}"
+    return "?"
+
+
+def _worker_name(command: str) -> str:
+    """Worker name from a ``worker start`` command line."""
+    if match := _WORKER_NAME_RE.search(command):
+        # Worker name from the --worker or -w argument
+        return match.group(1)
+    if "--all" in command or " -a " in command or command.strip().endswith(" -a"):
+        return "all"
+    return "unknown"
+
+
+def _format_worker_row(worker_name: str, process_type: str, row: _PsRow, full_command: bool = False) -> str:
+    """One line of the worker ps / killall table."""
+    # Worker name and process type fit in 25 characters
+    worker_display = f"{worker_name} ({process_type})"[:25].ljust(25)
+    line = (f"{worker_display} {row.user:<10} {row.pid:<6} {row.cpu:<5} {row.mem:<5} {row.vsz:<8} "
+            f"{row.rss:<8} {row.tty:<8} {row.stat:<5} {row.start:<8} {row.time:<8}")
+    return f"{line} {row.command}" if full_command else line
+
+
+def determine_process_type(current_pid: int, ppid: Optional[int], memory_usage: float,
+                           table: Optional[_ProcTable] = None) -> str:
     """Determine process type based on hierarchy and characteristics."""
     if ppid is None:
         return "unknown"
+    if table is None:
+        table = _process_table()
 
     # Check if parent is a CLI process
-    try:
-        parent_result = subprocess.run(
-            ["ps", "-p", str(ppid), "-o", "command="],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        if "idflow worker start" in parent_result.stdout:
-            # This is a child of CLI, determine if task-mgr or worker
-            # Task-manager typically has lower memory usage and is usually the first child
-            # We can also check the process start time to determine order
-            try:
-                # Get process start time to determine order
-                start_time_result = subprocess.run(
-                    ["ps", "-o", "lstart=", "-p", str(current_pid)],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                start_time = start_time_result.stdout.strip()
-
-                # Get all children of the parent to determine order
-                children_result = subprocess.run(
-                    ["ps", "--ppid", str(ppid), "-o", "pid,lstart="],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                children_lines = children_result.stdout.strip().split('\n')
-                children_pids = []
-                for line in children_lines:
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            children_pids.append(int(parts[0]))
-
-                # Sort by PID to get creation order
-                children_pids.sort()
-
-                # The first child is typically the task-manager
-                if current_pid == children_pids[0]:
-                    return "task-mgr"
-                else:
-                    return "worker"
-            except (subprocess.CalledProcessError, ValueError, IndexError):
-                # Fallback to memory usage
-                if memory_usage < 1.0:  # Less than 1% memory
-                    return "task-mgr"
-                else:
-                    return "worker"
-        else:
-            return "unknown"
-    except (subprocess.CalledProcessError, ValueError):
+    parent = table.procs.get(ppid)
+    if parent is None or "idflow worker start" not in parent.command:
         return "unknown"
 
+    # This is a child of CLI, determine if task-mgr or worker.
+    # The first child started is typically the task-manager
+    children_pids = table.children_of(ppid)
+    if not children_pids:
+        # Fallback to memory usage: task-manager typically has lower memory usage
+        return "task-mgr" if memory_usage < 1.0 else "worker"
+    return "task-mgr" if current_pid == children_pids[0] else "worker"
+
+
+def _classify_worker_process(pid: int, memory_usage: float, table: _ProcTable) -> str:
+    """Classify an ``idflow worker start`` process as cli, task-mgr or worker."""
+    # CLI is the root process: it has other idflow worker start processes as children
+    if any("idflow worker start" in table.procs[child].command for child in table.children_of(pid)):
+        return "cli"
+    info = table.procs.get(pid)
+    return determine_process_type(pid, info.ppid if info else None, memory_usage, table)
+
 app = typer.Typer(help="Manages task workers")
 
 # Import common help utilities
@@ -104,49 +365,58 @@ def worker_main(
     pass
 
 
-def discover_worker_files() -> List[Path]:
-    """Discover worker Python files from package and project (overlay by dir)."""
+def discover_worker_files() -> List[Tuple[Path, str]]:
+    """Discover worker Python files from package and project (overlay by dir).
+
+    Returns ``(file, task_name)`` pairs; each file is read exactly once.
+    """
     from idflow.core.resource_resolver import ResourceResolver
     resolver = ResourceResolver()
-    files: List[Path] = []
+    files: List[Tuple[Path, str]] = []
 
     # Collect all task files using ResourceResolver
-    task_files = resolver.collect_flattened_files("tasks", "*.py")
+    task_files = resolver.collect_flattened_files("tasks", "*.py", exclude_filenames={"__init__.py"})
 
     for task_file in task_files:
-        if task_file.name != "__init__.py":
-            try:
-                if "@worker_task" in task_file.read_text(encoding='utf-8'):
-                    files.append(task_file)
-            except Exception:
-                continue
+        task_name = _read_worker_task_name(task_file)
+        if task_name:
+            files.append((task_file, task_name))
     return files
 
 
-def extract_task_name_from_file(task_file: Path) -> Optional[str]:
-    """Extract task name from worker file."""
+def _read_worker_task_name(task_file: Path) -> Optional[str]:
+    """Return the worker task name declared in a file, or None if it has no worker."""
     try:
-        with open(task_file, 'r', encoding='utf-8') as f:
+        with open(task_file, 'rb') as f:
             content = f.read()
-
-        import re
-        match = re.search(r"@worker_task\(task_definition_name='([^']+)'\)", content)
-        if match:
-            return match.group(1)
-        else:
-            return task_file.name.replace(".py", "")
+        if b"@worker_task" not in content:
+            return None
+        match = _TASK_NAME_RE.search(content)
+        return match.group(1).decode('utf-8') if match else task_file.stem
     except Exception:
-        pass
-
-    return None
+        return None
 
 
 def load_task_function(task_file: Path, task_name: str):
-    """Load the task function from a Python file."""
+    """Load the task function from a Python file.
+
+    Each file is imported under its own module name and registered in
+    ``sys.modules``, so loading several workers doesn't clobber one shared
+    module and a file already loaded in this process isn't executed again.
+    """
+    module_name = f"idflow_task_{task_name}"
+    existing = sys.modules.get(module_name)
+    if existing is not None and getattr(existing, '__file__', None) == str(task_file):
+        return
     try:
-        spec = importlib.util.spec_from_file_location('task_module', str(task_file))
+        spec = importlib.util.spec_from_file_location(module_name, str(task_file))
         task_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(task_module)
+        sys.modules[module_name] = task_module
+        try:
+            spec.loader.exec_module(task_module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
     except ImportError as e:
         typer.echo(f"✗ Failed to load worker {task_name}: Missing dependencies")
         typer.echo(f"  Install with: pip install idflow[ <dep-category> ]")
@@ -169,24 +439,11 @@ def list_workers():
     lib_t, vend_t, proj_t = resolver.names_by_base("tasks", "*", name_extractor=None, item_type="dir")
     task_names = sorted(set().union(lib_t, vend_t, proj_t))
 
-    # Filter to only worker tasks (containing @worker_task)
+    # Filter to only worker tasks (directories containing an @worker_task file)
+    worker_dirs = {part for task_file, _ in discover_worker_files() for part in task_file.parent.parts}
     worker_tasks = []
     for name in task_names:
-        # Check if this task directory contains worker files
-        task_files = resolver.collect_flattened_files("tasks", "*.py")
-        has_worker = False
-
-        for task_file in task_files:
-            # Check if this file belongs to this task (by directory name)
-            if name in str(task_file.parent):
-                try:
-                    if "@worker_task" in task_file.read_text(encoding='utf-8'):
-                        has_worker = True
-                        break
-                except Exception:
-                    continue
-
-        if has_worker:
+        if name in worker_dirs:
             origin, short = resolver.classify_origin_from_sets(name, lib_t, vend_t, proj_t)
             status = "active" if name in required_tasks else "unused"
 
@@ -202,9 +459,11 @@ def list_workers():
         typer.echo("No worker files found")
         return
 
+    lines = []
     for worker in worker_tasks:
         status_color = "green" if worker["status"] == "active" else "red"
-        typer.echo(f"{worker['name']:<30} {typer.style(worker['status'], fg=status_color):<7} {worker['origin']}")
+        lines.append(f"{worker['name']:<30} {typer.style(worker['status'], fg=status_color):<7} {worker['origin']}")
+    typer.echo("\n".join(lines))
 
 
 @app.command("ps")
@@ -214,149 +473,46 @@ def list_running_workers(
     """List running worker processes."""
     try:
         # Find Python processes that look like workers
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        lines = result.stdout.split('\n')
-        worker_lines = []
-
-        for line in lines:
-            # Look for processes that contain idflow and worker-related terms
-            # But exclude kernel workers, system processes, and CLI commands
-            if (any(term in line.lower() for term in ['idflow', 'conductor']) or
-                ('python' in line.lower() and any(term in line.lower() for term in ['worker', 'task', 'conductor']))):
-                # Skip the header line, kernel workers, and CLI commands
-                if (not line.startswith('USER') and
-                    not line.startswith('root') and
-                    'kworker' not in line and
-                    'worker ps' not in line and
-                    'worker killall' not in line and
-                    'worker list' not in line and
-                    'worker start' in line):  # Only show actual worker start processes
-                    worker_lines.append(line)
-
-        if worker_lines:
+        rows, table = _worker_rows()
+        # Skip kernel workers, system processes and commands not run via
+        # idflow, conductor or python
+        worker_rows = [
+            row for row in rows
+            if not row.user.startswith('root') and _LISTED_WORKER_COMMAND_RE.match(row.command)
+        ]
+
+        if worker_rows:
             typer.echo("Running worker processes:")
             if full_command:
                 typer.echo("WORKER                    USER       PID  %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND")
             else:
                 typer.echo("WORKER                    USER       PID  %CPU %MEM    VSZ   RSS TTY      STAT START   TIME")
 
-            for line in worker_lines:
-                # Extract worker name and process type from command line
-                worker_name = "unknown"
-                process_type = "unknown"
-
-                if "--worker" in line or " -w " in line:
-                    # Extract worker name from --worker or -w argument
-                    import re
-                    match = re.search(r'(?:--worker|-w)\s+(\w+)', line)
-                    if match:
-                        worker_name = match.group(1)
-                elif "--all" in line or " -a " in line or line.strip().endswith(" -a"):
-                    worker_name = "all"
-
+            for row in worker_rows:
                 # Determine process type based on process hierarchy and command line
-                parts = line.split()
-                if len(parts) >= 2:
+                command = row.command
+                process_type = "unknown"
+                if full_command:
+                    # For full command output, we can see the actual command
+                    if "conductor.client.automator.task_handler" in command or "TaskHandler" in command:
+                        process_type = "task-mgr"
+                    elif "conductor.client.automator.task_runner" in command or "TaskRunner" in command:
+                        process_type = "worker"
+                    elif "idflow worker start" in command:
+                        process_type = "cli"
+                else:
+                    # For non-full output, use hierarchy-based detection
+                    # CLI is typically the root process (no other idflow worker start as parent)
+                    # Task-manager is a child of CLI
+                    # Worker is a child of task-manager or CLI
                     try:
-                        current_pid = int(parts[1])
-
-                        # Get parent process ID
-                        try:
-                            ppid_result = subprocess.run(
-                                ["ps", "-o", "ppid=", "-p", str(current_pid)],
-                                capture_output=True,
-                                text=True,
-                                check=True
-                            )
-                            ppid = int(ppid_result.stdout.strip())
-                        except (ValueError, subprocess.CalledProcessError):
-                            ppid = None
-
-                        # Determine process type based on hierarchy and command line
-                        if full_command:
-                            # For full command output, we can see the actual command
-                            if "conductor.client.automator.task_handler" in line or "TaskHandler" in line:
-                                process_type = "task-mgr"
-                            elif "conductor.client.automator.task_runner" in line or "TaskRunner" in line:
-                                process_type = "worker"
-                            elif "idflow worker start" in line:
-                                process_type = "cli"
-                            else:
-                                process_type = "unknown"
-                        else:
-                            # For non-full output, use hierarchy-based detection
-                            # CLI is typically the root process (no other idflow worker start as parent)
-                            # Task-manager is a child of CLI
-                            # Worker is a child of task-manager or CLI
-
-                            # Check if this process has other idflow worker start processes as children
-                            has_worker_children = False
-                            try:
-                                children_result = subprocess.run(
-                                    ["ps", "--ppid", str(current_pid), "-o", "pid="],
-                                    capture_output=True,
-                                    text=True,
-                                    check=True
-                                )
-                                child_pids = children_result.stdout.strip().split('\n')
-                                child_pids = [pid.strip() for pid in child_pids if pid.strip()]
-
-                                # Check if any children are idflow worker processes
-                                for child_pid in child_pids:
-                                    if child_pid:
-                                        child_result = subprocess.run(
-                                            ["ps", "-p", child_pid, "-o", "command="],
-                                            capture_output=True,
-                                            text=True,
-                                            check=True
-                                        )
-                                        if "idflow worker start" in child_result.stdout:
-                                            has_worker_children = True
-                                            break
-                            except (subprocess.CalledProcessError, ValueError):
-                                pass
-
-                            if has_worker_children:
-                                process_type = "cli"
-                            else:
-                                # Use the helper function to determine process type
-                                try:
-                                    memory_usage = float(parts[3])
-                                    process_type = determine_process_type(current_pid, ppid, memory_usage)
-                                except (ValueError, IndexError):
-                                    process_type = "unknown"
-                    except (ValueError, IndexError):
+                        if table is None:
+                            table = _process_table()
+                        process_type = _classify_worker_process(row.pid, float(row.mem), table)
+                    except ValueError:
                         process_type = "unknown"
-                else:
-                    process_type = "unknown"
-
-                # Format worker name and process type
-                worker_display = f"{worker_name} ({process_type})"[:25].ljust(25)
-
-                # Parse the ps output
-                parts = line.split()
-                if len(parts) >= 11:
-                    if full_command:
-                        # Show full command
-                        command_start = 10  # Start of command in ps output
-                        command = " ".join(parts[command_start:])
-                        new_line = f"{worker_display} {parts[0]:<10} {parts[1]:<6} {parts[2]:<5} {parts[3]:<5} {parts[4]:<8} {parts[5]:<8} {parts[6]:<8} {parts[7]:<5} {parts[8]:<8} {parts[9]:<8} {command}"
-                    else:
-                        # Show only worker name, no command
-                        new_line = f"{worker_display} {parts[0]:<10} {parts[1]:<6} {parts[2]:<5} {parts[3]:<5} {parts[4]:<8} {parts[5]:<8} {parts[6]:<8} {parts[7]:<5} {parts[8]:<8} {parts[9]:<8}"
-                    typer.echo(new_line)
-                else:
-                    # Fallback to original line if parsing fails
-                    if full_command:
-                        typer.echo(f"{worker_display} {line}")
-                    else:
-                        typer.echo(f"{worker_display} {line}")
+
+                typer.echo(_format_worker_row(_worker_name(command), process_type, row, full_command))
         else:
             typer.echo("No worker processes found")
 
@@ -376,132 +532,41 @@ def kill_workers(
 ):
     """Kill worker processes by worker name substring."""
     try:
-        # First, list processes that match the pattern
-        result = subprocess.run(
-            ["ps", "aux"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        # First, list processes that match the pattern; the process table
+        # for hierarchy lookups comes with the rows, or is taken once later
+        rows, table = _worker_rows()
+        matching = []
 
-        lines = result.stdout.split('\n')
-        matching_pids = []
+        for row in rows:
+            worker_name = _worker_name(row.command)
 
-        for line in lines:
-            # Only match actual worker processes, not CLI commands
-            if ('worker start' in line and
-                'worker ps' not in line and
-                'worker killall' not in line and
-                'worker list' not in line and
-                not line.startswith('USER')):
-
-                # Extract worker name and process type from command line
-                worker_name = "unknown"
+            # Determine process type based on process hierarchy
+            try:
+                if table is None:
+                    table = _process_table()
+                process_type = _classify_worker_process(row.pid, float(row.mem), table)
+            except ValueError:
                 process_type = "unknown"
 
-                if "--worker" in line or " -w " in line:
-                    import re
-                    match = re.search(r'(?:--worker|-w)\s+(\w+)', line)
-                    if match:
-                        worker_name = match.group(1)
-                elif "--all" in line or " -a " in line or line.strip().endswith(" -a"):
-                    worker_name = "all"
+            # If no pattern provided, match all workers
+            # If pattern provided, check if it's contained in worker name
+            if pattern is None or pattern.lower() in worker_name.lower():
+                matching.append((row, worker_name, process_type))
 
-                # Determine process type based on process hierarchy and command line
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        current_pid = int(parts[1])
-
-                        # Get parent process ID
-                        try:
-                            ppid_result = subprocess.run(
-                                ["ps", "-o", "ppid=", "-p", str(current_pid)],
-                                capture_output=True,
-                                text=True,
-                                check=True
-                            )
-                            ppid = int(ppid_result.stdout.strip())
-                        except (ValueError, subprocess.CalledProcessError):
-                            ppid = None
-
-                        # Check if this process has other idflow worker start processes as children
-                        has_worker_children = False
-                        try:
-                            children_result = subprocess.run(
-                                ["ps", "--ppid", str(current_pid), "-o", "pid="],
-                                capture_output=True,
-                                text=True,
-                                check=True
-                            )
-                            child_pids = children_result.stdout.strip().split('\n')
-                            child_pids = [pid.strip() for pid in child_pids if pid.strip()]
-
-                            # Check if any children are idflow worker processes
-                            for child_pid in child_pids:
-                                if child_pid:
-                                    child_result = subprocess.run(
-                                        ["ps", "-p", child_pid, "-o", "command="],
-                                        capture_output=True,
-                                        text=True,
-                                        check=True
-                                    )
-                                    if "idflow worker start" in child_result.stdout:
-                                        has_worker_children = True
-                                        break
-                        except (subprocess.CalledProcessError, ValueError):
-                            pass
-
-                        if has_worker_children:
-                            process_type = "cli"
-                        else:
-                            # Use the helper function to determine process type
-                            try:
-                                memory_usage = float(parts[3])
-                                process_type = determine_process_type(current_pid, ppid, memory_usage)
-                            except (ValueError, IndexError):
-                                process_type = "unknown"
-                    except (ValueError, IndexError):
-                        process_type = "unknown"
-                else:
-                    process_type = "unknown"
-
-                # If no pattern provided, match all workers
-                # If pattern provided, check if it's contained in worker name
-                if pattern is None or pattern.lower() in worker_name.lower():
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        try:
-                            pid = int(parts[1])
-                            matching_pids.append((pid, line, worker_name, process_type))
-                        except ValueError:
-                            continue
-
-        if not matching_pids:
+        if not matching:
             pattern_desc = "any pattern" if pattern is None else f"pattern '{pattern}'"
             typer.echo(f"No worker processes found matching {pattern_desc}")
             return
 
         pattern_desc = "all workers" if pattern is None else f"pattern '{pattern}'"
-        typer.echo(f"Found {len(matching_pids)} worker processes matching {pattern_desc}:")
+        typer.echo(f"Found {len(matching)} worker processes matching {pattern_desc}:")
         typer.echo("WORKER                    USER       PID  %CPU %MEM    VSZ   RSS TTY      STAT START   TIME")
-
-        for pid, line, worker_name, process_type in matching_pids:
-            # Format worker name and process type to fit in 25 characters
-            worker_display = f"{worker_name} ({process_type})"[:25].ljust(25)
-
-            # Parse the ps output
-            parts = line.split()
-            if len(parts) >= 11:
-                # Show only worker name, no command (like ps without --full)
-                new_line = f"{worker_display} {parts[0]:<10} {parts[1]:<6} {parts[2]:<5} {parts[3]:<5} {parts[4]:<8} {parts[5]:<8} {parts[6]:<8} {parts[7]:<5} {parts[8]:<8} {parts[9]:<8}"
-                typer.echo(new_line)
-            else:
-                # Fallback to original line if parsing fails
-                typer.echo(f"{worker_display} {line}")
+        for row, worker_name, process_type in matching:
+            # Show only worker name, no command (like ps without --full)
+            typer.echo(_format_worker_row(worker_name, process_type, row))
 
         if not yes:
-            confirm = typer.confirm(f"Kill these {len(matching_pids)} processes?")
+            confirm = typer.confirm(f"Kill these {len(matching)} processes?")
             if not confirm:
                 typer.echo("Cancelled")
                 return
@@ -509,7 +574,8 @@ def kill_workers(
         # Kill the processes
         killed_count = 0
         signal_name = "SIGKILL" if kill else "SIGTERM"
-        for pid, line, worker_name, process_type in matching_pids:
+        for row, worker_name, process_type in matching:
+            pid = row.pid
             try:
                 signal_to_use = signal.SIGKILL if kill else signal.SIGTERM
                 os.kill(pid, signal_to_use)
@@ -550,11 +616,9 @@ def start_workers(
 
     # Filter workers if specific ones requested
     selected_workers = []
-    for task_file in worker_files:
-        task_name = extract_task_name_from_file(task_file)
-        if task_name:
-            if all or (workers and task_name in workers):
-                selected_workers.append((task_file, task_name))
+    for task_file, task_name in worker_files:
+        if all or (workers and task_name in workers):
+            selected_workers.append((task_file, task_name))
 
     if not selected_workers:
         typer.echo("No workers selected")
@@ -562,6 +626,11 @@ def start_workers(
 
     typer.echo(f"Starting {len(selected_workers)} workers...")
 
+    # The Conductor SDK is slow to import; only worker start needs it
+    from conductor.client.configuration.configuration import Configuration
+    from conductor.client.worker.worker import Worker
+    from conductor.client.automator.task_handler import TaskHandler
+
     # # Read configuration
     # from ...core.config import get_config
     # config = get_config()
@@ -645,32 +714,19 @@ def start_workers(
 
         # Also kill any remaining worker processes directly (Only those that are children of the current process)
         try:
-            result = subprocess.run(
-                ["ps", "aux"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            lines = result.stdout.split('\n')
             killed_count = 0
-            for line in lines:
-                if ('worker start' in line and
-                    'worker ps' not in line and
-                    'worker killall' not in line and
-                    'worker list' not in line and
-                    not line.startswith('USER')):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        try:
-                            pid = int(parts[1])
-                            # Check if this process is a child of the current process
-                            # by checking if it's in our worker_pids list or if it's a direct child
-                            if pid in worker_pids or is_child_process(pid, current_pid):
-                                os.kill(pid, signal.SIGTERM)
-                                killed_count += 1
-                        except (ValueError, ProcessLookupError, PermissionError):
-                            pass
+            # One process snapshot gives the rows and answers every is_child_process() below
+            with oneshot():
+                rows, _ = _worker_rows()
+                for row in rows:
+                    try:
+                        # Check if this process is a child of the current process
+                        # by checking if it's in our worker_pids list or if it's a direct child
+                        if row.pid in worker_pids or is_child_process(row.pid, current_pid):
+                            os.kill(row.pid, signal.SIGTERM)
+                            killed_count += 1
+                    except (ProcessLookupError, PermissionError):
+                        pass
 
             if killed_count > 0:
                 print(f"Killed {killed_count} worker processes")
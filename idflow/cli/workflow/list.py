@@ -1,6 +1,5 @@
 from __future__ import annotations
 import typer
-from idflow.core.workflow_manager import get_workflow_manager
 
 
 def list_workflows(
@@ -10,6 +9,8 @@ def list_workflows(
     versions: bool = typer.Option(True, "--versions/--no-versions", help="Show version information for workflows")
 ):
     """List workflows (local files and/or remote)."""
+    from idflow.core.workflow_manager import get_workflow_manager
+
     workflow_manager = get_workflow_manager()
 
     # Handle remote-only mode
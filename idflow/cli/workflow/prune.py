@@ -1,13 +1,13 @@
 from __future__ import annotations
 import typer
 from typing import Optional, List, Dict, Any
-from idflow.core.workflow_manager import get_workflow_manager
-from idflow.core.conductor_client import _get_base_url, _get_headers
-import requests
 
 
 def _check_workflow_runs(workflow_name: str, version: Optional[int] = None) -> List[Dict[str, Any]]:
     """Check if there are running or pending workflow runs for a given workflow."""
+    import requests
+    from idflow.core.conductor_client import _get_base_url, _get_headers
+
     try:
         base_url = _get_base_url()
         headers = _get_headers()
@@ -48,6 +48,9 @@ def _check_workflow_runs(workflow_name: str, version: Optional[int] = None) -> L
 
 def _delete_workflow_version(workflow_name: str, version: int) -> bool:
     """Delete a specific workflow version from remote."""
+    import requests
+    from idflow.core.conductor_client import _get_base_url, _get_headers
+
     try:
         base_url = _get_base_url()
         headers = _get_headers()
@@ -74,6 +77,8 @@ def prune_workflows(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be deleted without actually deleting")
 ):
     """Prune (delete) workflows and versions from remote that no longer exist locally."""
+    from idflow.core.workflow_manager import get_workflow_manager
+
     workflow_manager = get_workflow_manager()
 
     if dry_run:
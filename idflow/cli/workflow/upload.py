@@ -1,7 +1,6 @@
 from __future__ import annotations
 import typer
 from typing import Optional
-from idflow.core.workflow_manager import get_workflow_manager
 
 
 def upload_workflows(
@@ -9,6 +8,8 @@ def upload_workflows(
     workflow: Optional[str] = typer.Option(None, "--workflow", "-w", help="Specific workflow name to upload")
 ):
     """Upload all workflows to Conductor. Tasks are automatically registered via @worker_task decorators."""
+    from idflow.core.workflow_manager import get_workflow_manager
+
     workflow_manager = get_workflow_manager()
 
     if workflow:
@@ -26,20 +27,17 @@ def upload_workflows(
             typer.echo("No active workflows required by stages. Use --workflow to upload specific workflow.")
             return
 
-        # Upload required workflows
-        results = {}
-        for name in sorted(required):
-            single = workflow_manager.upload_single_workflow(name, force=force)
-            results.update(single)
+        # Upload required workflows in one discovery pass
+        results = workflow_manager.upload_workflows(force=force, names=required)
 
     # Show results only for actually uploaded workflows
     if hasattr(workflow_manager, '_last_upload_results'):
         upload_results = workflow_manager._last_upload_results
 
         if upload_results['uploaded']:
-            typer.echo("\nWorkflow upload results:")
-            for name in upload_results['uploaded']:
-                typer.echo(f"  ✓ {name}")
+            lines = ["\nWorkflow upload results:"]
+            lines.extend(f"  ✓ {name}" for name in upload_results['uploaded'])
+            typer.echo("\n".join(lines))
 
         if upload_results['skipped']:
             typer.echo(f"\nSkipped {len(upload_results['skipped'])} workflows (already up to date)")
@@ -54,9 +52,10 @@ def upload_workflows(
             typer.echo(f"\nSummary: All {total_count} workflows are up to date")
     else:
         # Fallback for old behavior
-        typer.echo("\nWorkflow upload results:")
+        lines = ["\nWorkflow upload results:"]
         for name, success in results.items():
             status = "✓" if success else "✗"
-            typer.echo(f"  {status} {name}")
+            lines.append(f"  {status} {name}")
+        typer.echo("\n".join(lines))
 
     typer.echo("Tasks will be automatically registered when workers start.")
@@ -1,16 +1,19 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar, Union, TYPE_CHECKING
 from uuid import uuid4
 
-from .models import DocRef, FileRef, VALID_STATUS, VALID_STAGE_STATUS
+from .models import DocRef, FileRef, doc_ref_to_dict, file_ref_to_dict, VALID_STATUS, VALID_STAGE_STATUS
 
 if TYPE_CHECKING:
     from .stage import Stage
 
 T = TypeVar('T', bound='Document')
 
+# Stage statuses that still block creating another stage of the same name
+_OPEN_STAGE_STATUS = frozenset({"scheduled", "active"})
+
 class Document(ABC):
     """
     Base Document ORM class that provides lifecycle hooks, relations, and query methods.
@@ -119,14 +122,14 @@ class Document(ABC):
         """Add a document reference."""
         ref = DocRef(key=key, uuid=uuid, data=data or {})
         self.doc_refs.append(ref)
-        self._data['_doc_refs'] = [ref.model_dump() for ref in self.doc_refs]
+        self._data.setdefault('_doc_refs', []).append(doc_ref_to_dict(ref))
         return ref
 
     def add_file_ref(self, key: str, filename: str, uuid: str, data: Optional[Dict[str, Any]] = None) -> FileRef:
         """Add a file reference."""
         ref = FileRef(key=key, filename=filename, uuid=uuid, data=data or {})
         self.file_refs.append(ref)
-        self._data['_file_refs'] = [ref.model_dump() for ref in self.file_refs]
+        self._data.setdefault('_file_refs', []).append(file_ref_to_dict(ref))
         return ref
 
     def add_stage(self, name: str, **kwargs) -> 'Stage':
@@ -201,8 +204,8 @@ class Document(ABC):
                 del result[attr]
 
         # Add the serialized references
-        result['_doc_refs'] = [ref.model_dump() for ref in self.doc_refs]
-        result['_file_refs'] = [ref.model_dump() for ref in self.file_refs]
+        result['_doc_refs'] = [doc_ref_to_dict(ref) for ref in self.doc_refs]
+        result['_file_refs'] = [file_ref_to_dict(ref) for ref in self.file_refs]
 
         return result
 
@@ -308,6 +311,11 @@ class Document(ABC):
         """Find documents matching the given filters."""
         return cls._where(**filters)
 
+    @classmethod
+    def iter_where(cls: Type[T], **filters) -> Iterator[T]:
+        """Iterate over documents matching the given filters as they are loaded."""
+        return cls._iter_where(**filters)
+
     @classmethod
     @abstractmethod
     def _find(cls: Type[T], uuid: str) -> Optional[T]:
@@ -320,10 +328,15 @@ class Document(ABC):
         """Internal where implementation. Override in subclasses."""
         pass
 
+    @classmethod
+    def _iter_where(cls: Type[T], **filters) -> Iterator[T]:
+        """Internal iter_where implementation. Override in subclasses that can stream."""
+        return iter(cls._where(**filters))
+
     def _handle_stage_lifecycle(self) -> None:
         """Handle stage lifecycle based on document status changes."""
         # Get all stages in scheduled or active status
-        active_stages = [s for s in self.stages if s.status in {"scheduled", "active"}]
+        active_stages = [s for s in self.stages if s.status in _OPEN_STAGE_STATUS]
 
         if not active_stages:
             return
@@ -362,7 +375,7 @@ class Document(ABC):
 
     def _cancel_all_stages(self) -> None:
         """Cancel all scheduled and active stages before document destruction."""
-        active_stages = [s for s in self.stages if s.status in {"scheduled", "active"}]
+        active_stages = [s for s in self.stages if s.status in _OPEN_STAGE_STATUS]
         for stage in active_stages:
             stage.status = "cancelled"
 
@@ -419,6 +432,13 @@ class Document(ABC):
                 }
             stages_to_evaluate = [stage_name]
 
+        # Resolve the definitions once, before the per-stage work
+        definitions = {}
+        for name in stages_to_evaluate:
+            stage_def = stage_definitions.get_definition(name)
+            if stage_def:
+                definitions[name] = stage_def
+
         # Track results
         total_evaluated = 0
         stages_started = 0
@@ -430,13 +450,14 @@ class Document(ABC):
         has_stages = len(self.stages) > 0
         original_status = self.status
 
-        for stage_name in stages_to_evaluate:
-            stage_def = stage_definitions.get_definition(stage_name)
-            if not stage_def:
-                continue
+        # Group existing stages once instead of rescanning them per definition
+        stages_by_name: Dict[str, List['Stage']] = {}
+        for existing in self.stages:
+            stages_by_name.setdefault(existing.name, []).append(existing)
 
+        for stage_name, stage_def in definitions.items():
             # Check if stage already exists for this document
-            existing_stages = self.get_stages(stage_name)
+            existing_stages = stages_by_name.get(stage_name)
 
             # Determine if we can create/rerun this stage
             can_create = True
@@ -448,16 +469,17 @@ class Document(ABC):
 
             if existing_stages:
                 # Check if any stage is still active (scheduled or active)
-                active_stages = [s for s in existing_stages if s.status in {"scheduled", "active"}]
-                if active_stages:
+                active_stage = next((s for s in existing_stages if s.status in _OPEN_STAGE_STATUS), None)
+                multiple_callable = stage_def.multiple_callable
+                if active_stage is not None:
                     can_create = False
-                    skip_reason = f"already has active stage (status: {active_stages[0].status})"
+                    skip_reason = f"already has active stage (status: {active_stage.status})"
                 elif not allow_rerun:
                     can_create = False
                     skip_reason = "already exists"
-                    if stage_def.multiple_callable:
+                    if multiple_callable:
                         skip_reason += " (use --allow-rerun to rerun completed stages)"
-                elif not stage_def.multiple_callable:
+                elif not multiple_callable:
                     can_create = False
                     skip_reason = "not marked as multiple_callable in stage definition"
 
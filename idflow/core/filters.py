@@ -1,18 +1,31 @@
-import fnmatch, re
-from typing import Any
+import fnmatch, operator, re
+from typing import Any, Callable
 
 _cmp_re = re.compile(r'^\s*(==|!=|>=|<=|>|<)\s*(.+)\s*$')
 
-def match_filter(prop_value: Any, expr: str) -> bool:
+_CMP_OPS = {"==": operator.eq, "!=": operator.ne, ">": operator.gt,
+            "<": operator.lt, ">=": operator.ge, "<=": operator.le}
+
+def compile_filter(expr: str) -> Callable[[Any], bool]:
+    """Parse a filter expression once and return a predicate for property values."""
     m = _cmp_re.match(expr)
     if m:
         op, rhs = m.groups()
+        cmp = _CMP_OPS[op]
         try:
-            pv = float(prop_value); rv = float(rhs)
+            rv = float(rhs)
         except Exception:
-            return False
-        return {"==": pv == rv,"!=": pv != rv,">": pv > rv,"<": pv < rv,">=": pv >= rv,"<=": pv <= rv}[op]
+            return lambda prop_value: False
+        def numeric(prop_value: Any) -> bool:
+            try:
+                pv = float(prop_value)
+            except Exception:
+                return False
+            return cmp(pv, rv)
+        return numeric
     if expr.strip().lower() == "exists":
-        return bool(prop_value)
-    return fnmatch.fnmatch(str(prop_value), expr)
+        return bool
+    return lambda prop_value: fnmatch.fnmatch(str(prop_value), expr)
 
+def match_filter(prop_value: Any, expr: str) -> bool:
+    return compile_filter(expr)(prop_value)
@@ -1,13 +1,15 @@
 from __future__ import annotations
+import errno
+import os
 import shutil
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar
 from uuid import uuid4
 
 from .document import Document
 from .stage import Stage
 from .models import FileRef
-from .io import ensure_dir, write_frontmatter, read_frontmatter
+from .io import ensure_dir, write_frontmatter, read_frontmatter, copy_file
 from .repo import find_doc_dir
 from .config import config
 
@@ -21,6 +23,11 @@ class FSMarkdownDocument(Document):
     where each document is stored as a markdown file with YAML frontmatter.
     """
 
+    # uuid -> status directory the document was last seen in (process lifetime).
+    # Only locations are cached, never document objects; entries are verified
+    # on lookup and kept current by save/move/destroy.
+    _status_cache: Dict[str, str] = {}
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Store the original status for status change detection (internal only)
@@ -130,6 +137,7 @@ class FSMarkdownDocument(Document):
         doc_data.pop('_original_status', None)
 
         write_frontmatter(self.doc_file, doc_data, self.body)
+        FSMarkdownDocument._status_cache[self.id] = self.status
 
     def _move_to_status_directory(self) -> None:
         """Move the document directory to the correct status directory."""
@@ -155,7 +163,13 @@ class FSMarkdownDocument(Document):
             if new_dir.exists():
                 # Remove the new directory if it exists (shouldn't happen, but just in case)
                 shutil.rmtree(new_dir)
-            shutil.move(str(old_dir), str(new_dir))
+            try:
+                # Same base_dir, so this is normally a single rename(2)
+                os.replace(old_dir, new_dir)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(str(old_dir), str(new_dir))
 
             # Reset internal paths so they get recalculated with new status
             self._doc_dir = None
@@ -172,6 +186,7 @@ class FSMarkdownDocument(Document):
         """Destroy the document from the filesystem."""
         if self.doc_dir.exists():
             shutil.rmtree(self.doc_dir)
+        FSMarkdownDocument._status_cache.pop(self.id, None)
 
     @classmethod
     def _find(cls: Type[T], uuid: str) -> Optional[T]:
@@ -179,6 +194,12 @@ class FSMarkdownDocument(Document):
         base_dir = config.base_dir
         valid_statuses = ['inbox', 'active', 'done', 'blocked', 'archived']
 
+        # Probe the last known status directory first
+        cached = FSMarkdownDocument._status_cache.get(uuid)
+        if cached in valid_statuses:
+            valid_statuses.remove(cached)
+            valid_statuses.insert(0, cached)
+
         for status in valid_statuses:
             doc_dir = base_dir / status / uuid
             doc_file = doc_dir / "doc.md"
@@ -194,6 +215,7 @@ class FSMarkdownDocument(Document):
                     # Reset internal paths so they get recalculated
                     doc._doc_dir = None
                     doc._doc_file = None
+                    FSMarkdownDocument._status_cache[uuid] = status
                     return doc
                 except Exception:
                     continue
@@ -203,25 +225,31 @@ class FSMarkdownDocument(Document):
     @classmethod
     def _where(cls: Type[T], **filters) -> List[T]:
         """Find documents matching the given filters in the filesystem."""
+        return list(cls._iter_where(**filters))
+
+    @classmethod
+    def _iter_where(cls: Type[T], **filters) -> Iterator[T]:
+        """Yield documents matching the given filters, reading one at a time.
+
+        Each status directory is listed before its documents are yielded, but
+        a document the caller moves to a later status may be yielded again.
+        """
         base_dir = config.base_dir
-        documents = []
         valid_statuses = ['inbox', 'active', 'done', 'blocked', 'archived']
 
         for status in valid_statuses:
-            status_dir = base_dir / status
-            if not status_dir.exists():
+            try:
+                entries = os.scandir(base_dir / status)
+            except FileNotFoundError:
                 continue
 
-            for doc_dir in status_dir.iterdir():
-                if not doc_dir.is_dir():
-                    continue
-
-                doc_file = doc_dir / "doc.md"
-                if not doc_file.exists():
-                    continue
+            with entries:
+                doc_dirs = [entry.path for entry in entries if entry.is_dir()]
 
+            for doc_dir in doc_dirs:
                 try:
-                    doc_data, body = read_frontmatter(doc_file)
+                    # Missing doc.md (FileNotFoundError) is skipped like a corrupt one
+                    doc_data, body = read_frontmatter(Path(doc_dir) / "doc.md")
                     doc = cls(body=body, **doc_data)
                     # Store the original status for status change detection
                     doc._original_status = status
@@ -229,13 +257,12 @@ class FSMarkdownDocument(Document):
                     doc._persisted = True
 
                     # Apply filters
-                    if cls._matches_filters(doc, filters):
-                        documents.append(doc)
+                    if not cls._matches_filters(doc, filters):
+                        continue
                 except Exception:
                     # Skip corrupted documents
                     continue
-
-        return documents
+                yield doc
 
     @classmethod
     def _matches_filters(cls, doc: T, filters: Dict[str, Any]) -> bool:
@@ -304,8 +331,8 @@ class FSMarkdownDocument(Document):
         file_uuid = str(uuid4())
         dst_path = self.doc_dir / file_uuid
 
-        # Copy the file
-        shutil.copyfile(src_path, dst_path)
+        # Copy the file (in-kernel, without buffering it in memory)
+        copy_file(src_path, dst_path)
 
         # Create and add file reference
         file_ref = self.add_file_ref(
@@ -1,3 +1,4 @@
+import copy
 from pydantic import BaseModel, Field
 from typing import Any, Dict
 
@@ -12,6 +13,14 @@ class FileRef(BaseModel):
     uuid: str
     data: Dict[str, Any] = Field(default_factory=dict)
 
+# Plain-dict serializers for the hot paths (avoid model_dump() per ref);
+# data is deep-copied like model_dump(), so results never share state with the ref
+def doc_ref_to_dict(ref: DocRef) -> Dict[str, Any]:
+    return {"key": ref.key, "uuid": ref.uuid, "data": copy.deepcopy(ref.data)}
+
+def file_ref_to_dict(ref: FileRef) -> Dict[str, Any]:
+    return {"key": ref.key, "filename": ref.filename, "uuid": ref.uuid, "data": copy.deepcopy(ref.data)}
+
 VALID_STATUS = {"inbox","active","done","blocked","archived"}
 
 # Stage-specific statuses (different from Document statuses)
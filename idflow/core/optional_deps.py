@@ -13,41 +13,39 @@ from __future__ import annotations
 from typing import Dict, List, Optional, Tuple, Set
 from pathlib import Path
 import importlib.metadata
+import re
+
+
+# Requires-Dist value: "<requirement>[; <marker>]"
+_REQUIRES_DIST_RE = re.compile(r"^\s*([^;]+?)\s*(?:;\s*(.*))?$")
+# Support single or double quotes and case-insensitive 'extra =='
+_EXTRA_MARKER_RE = re.compile(r"extra\s*==\s*['\"]([^'\"]+)['\"]", flags=re.IGNORECASE)
 
 
 def _parse_requires_dist_for_extra(dist: importlib.metadata.Distribution) -> Dict[str, List[str]]:
     """
-    Parse METADATA to map extras to their Requires-Dist requirement specifiers.
+    Map extras to their Requires-Dist requirement specifiers.
 
     Returns: { extra_name: ["packageA>=1", "packageB"], ... }
     """
     extras: Dict[str, List[str]] = {}
     try:
-        lines = dist.metadata.as_string().splitlines()
+        # Pre-split Requires-Dist values; avoids serializing the whole METADATA
+        requires = dist.requires or []
     except Exception:
         return extras
 
-    current_requires: List[Tuple[str, Optional[str]]] = []
-    # We will scan Requires-Dist lines with markers like: extra == 'research'
-    import re
-    req_re = re.compile(r"^Requires-Dist:\s*([^;]+?)(?:;\s*(.*))?$")
-
-    for line in lines:
-        if not line.startswith("Requires-Dist:"):
-            continue
-        m = req_re.match(line)
+    # Markers look like: extra == 'research'
+    for value in requires:
+        m = _REQUIRES_DIST_RE.match(value)
         if not m:
             continue
         requirement = m.group(1)  # package and version specifier
         marker = m.group(2) or ""
         # Extract extra name from marker if present
-        extra_name = None
-        # Support single or double quotes and case-insensitive 'extra =='
-        em = re.search(r"extra\s*==\s*['\"]([^'\"]+)['\"]", marker or "", flags=re.IGNORECASE)
+        em = _EXTRA_MARKER_RE.search(marker)
         if em:
-            extra_name = em.group(1)
-        if extra_name:
-            extras.setdefault(extra_name, []).append(requirement)
+            extras.setdefault(em.group(1), []).append(requirement)
 
     return extras
 
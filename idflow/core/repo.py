@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import List, Optional
 from .models import VALID_STATUS
@@ -5,12 +6,17 @@ from .models import VALID_STATUS
 def doc_paths(base_dir: Path) -> List[Path]:
     paths: List[Path] = []
     for status in VALID_STATUS:
-        root = base_dir / status
-        if not root.exists(): continue
-        for uuid_dir in root.iterdir():
-            doc = uuid_dir / "doc.md"
-            if doc.is_file():
-                paths.append(doc)
+        try:
+            it = os.scandir(base_dir / status)
+        except FileNotFoundError:
+            continue
+        with it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                doc = Path(entry.path) / "doc.md"
+                if doc.is_file():
+                    paths.append(doc)
     return paths
 
 def find_doc_dir(base_dir: Path, uuid: str) -> Optional[Path]:
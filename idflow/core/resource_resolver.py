@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import Dict, List, Tuple, Callable, Optional, Set
 import importlib.resources as ir
@@ -14,6 +16,52 @@ def _package_root() -> Path:
         return Path("idflow").resolve()
 
 
+def _scan_files(root: Path, pattern: str, exclude_filenames: Set[str] = frozenset()) -> List[Path]:
+    """Files directly in ``root`` whose name matches ``pattern`` (one scandir, no per-entry stat)."""
+    try:
+        it = os.scandir(root)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    with it:
+        return [
+            Path(entry.path)
+            for entry in it
+            if fnmatchcase(entry.name, pattern)
+            and entry.name not in exclude_filenames
+            and entry.is_file()
+        ]
+
+
+# Directories that never hold resources; hidden directories (".venv", ".git", ...) are skipped too
+_SKIP_DIRS = frozenset({"__pycache__", "node_modules"})
+
+
+def _walk_files(root: Path, pattern: str, exclude_filenames: Set[str] = frozenset()) -> List[Path]:
+    """Recursive counterpart of ``_scan_files`` (like ``rglob``, not following symlinked dirs).
+
+    Cache, tooling and hidden directories are pruned instead of descended into.
+    """
+    files: List[Path] = []
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS and not entry.name.startswith("."):
+                        stack.append(entry.path)
+                elif (
+                    fnmatchcase(entry.name, pattern)
+                    and entry.name not in exclude_filenames
+                    and entry.is_file()
+                ):
+                    files.append(Path(entry.path))
+    return files
+
+
 class ResourceResolver:
     """
     Ermittelt Ressourcen über mehrere Basen in definierter Reihenfolge:
@@ -41,23 +89,18 @@ class ResourceResolver:
     # --- Generic collectors ---
     def _collect_dir_items(self, base: Path, subdir: str) -> Dict[str, Path]:
         result: Dict[str, Path] = {}
-        root = base / subdir
-        if not root.exists():
+        try:
+            it = os.scandir(base / subdir)
+        except (FileNotFoundError, NotADirectoryError):
             return result
-        for entry in root.iterdir():
-            if entry.is_dir():
-                result[entry.name] = entry
+        with it:
+            for entry in it:
+                if entry.is_dir():
+                    result[entry.name] = Path(entry.path)
         return result
 
     def _collect_file_items(self, base: Path, subdir: str, pattern: str) -> Dict[str, Path]:
-        result: Dict[str, Path] = {}
-        root = base / subdir
-        if not root.exists():
-            return result
-        for p in root.glob(pattern):
-            if p.is_file():
-                result[p.name] = p
-        return result
+        return {p.name: p for p in _scan_files(base / subdir, pattern)}
 
     def overlay_workflow_dirs(self) -> Dict[str, Path]:
         # Overlay in Reihenfolge lib -> vendors (n) -> project, wobei spaetere Eintraege ueberlagern
@@ -139,24 +182,17 @@ class ResourceResolver:
         exclude_filenames: optional set of exact file names to skip (e.g., event_handlers.json).
         """
         files: List[Path] = []
-        exclude_filenames = exclude_filenames or set()
-        # Overlay by dir, then rglob pattern within each dir
+        exclude_filenames = exclude_filenames or frozenset()
+        # Overlay by dir, then walk each dir recursively for the pattern
         for dir_path in self.target_dirs(subdir).values():
-            for f in dir_path.rglob(file_glob):
-                if f.name in exclude_filenames:
-                    continue
-                if f.is_file():
-                    files.append(f)
+            files.extend(_walk_files(dir_path, file_glob, exclude_filenames))
         return files
 
     def _collect_files_in_dirs(self, dirs_map: Dict[str, Path], file_glob: str, exclude_filenames: Optional[Set[str]] = None) -> List[Path]:
         files: List[Path] = []
-        exclude_filenames = exclude_filenames or set()
+        exclude_filenames = exclude_filenames or frozenset()
         for d in dirs_map.values():
-            for f in d.rglob(file_glob):
-                if f.name in exclude_filenames or not f.is_file():
-                    continue
-                files.append(f)
+            files.extend(_walk_files(d, file_glob, exclude_filenames))
         return files
 
     def collect_files_by_base(self, subdir: str, file_glob: str, exclude_filenames: Optional[Set[str]] = None) -> Tuple[List[Path], List[Path], List[Path]]:
@@ -178,22 +214,11 @@ class ResourceResolver:
         proj_files: List[Path] = []
         if not bases:
             return lib_files, vendor_files, proj_files
-        lib_base = bases[0]
-        for f in (lib_base / subdir).glob(file_glob):
-            if f.is_file() and f.name not in exclude_filenames:
-                lib_files.append(f)
+        lib_files = _scan_files(bases[0] / subdir, file_glob, exclude_filenames)
         if len(bases) > 1:
-            project_base = bases[-1]
-            for f in (project_base / subdir).glob(file_glob):
-                if f.is_file() and f.name not in exclude_filenames:
-                    proj_files.append(f)
+            proj_files = _scan_files(bases[-1] / subdir, file_glob, exclude_filenames)
         for base in bases[1:-1]:
-            root = base / subdir
-            if not root.exists():
-                continue
-            for f in root.glob(file_glob):
-                if f.is_file() and f.name not in exclude_filenames:
-                    vendor_files.append(f)
+            vendor_files.extend(_scan_files(base / subdir, file_glob, exclude_filenames))
         return lib_files, vendor_files, proj_files
 
     # Name extractors
@@ -312,17 +337,20 @@ class ResourceResolver:
                 subdir=subdir, file_glob=pattern, exclude_filenames=exclude_filenames
             )
 
+        # Extract every file's name once; extractors typically parse the file
+        file_names = {f: name_extractor(f) for f in lib_files + vendor_files + proj_files}
+
         # Precompute name sets
-        lib_names = self.names_from_files(lib_files, name_extractor)
-        vendor_names = self.names_from_files(vendor_files, name_extractor)
-        proj_names = self.names_from_files(proj_files, name_extractor)
+        lib_names = {file_names[f] for f in lib_files if file_names[f]}
+        vendor_names = {file_names[f] for f in vendor_files if file_names[f]}
+        proj_names = {file_names[f] for f in proj_files if file_names[f]}
 
         # Overlay index: lib -> vendors -> project
         flat_by_name: Dict[str, Path] = {}
 
         def _index(files: List[Path]) -> None:
             for f in files:
-                n = name_extractor(f)
+                n = file_names[f]
                 if n:
                     flat_by_name[n] = f
 
@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 from uuid import uuid4
 
-from .models import DocRef, FileRef, VALID_STAGE_STATUS
+from .models import DocRef, FileRef, doc_ref_to_dict, file_ref_to_dict, VALID_STAGE_STATUS
 from .document import Document
 
 T = TypeVar('T', bound='Stage')
@@ -104,8 +104,8 @@ class Stage(Document):
             del result['parent']
 
         # Add the serialized references
-        result['_doc_refs'] = [ref.model_dump() for ref in self.doc_refs]
-        result['_file_refs'] = [ref.model_dump() for ref in self.file_refs]
+        result['_doc_refs'] = [doc_ref_to_dict(ref) for ref in self.doc_refs]
+        result['_file_refs'] = [file_ref_to_dict(ref) for ref in self.file_refs]
 
         return result
 
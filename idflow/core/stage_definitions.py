@@ -2,7 +2,7 @@ from __future__ import annotations
 import yaml
 from pathlib import Path
 import importlib.resources as ir
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from pydantic import BaseModel, Field
 
 
@@ -77,6 +77,8 @@ class StageDefinition(BaseModel):
     multiple_callable: bool = False
     # Do not evaluate/schedule this stage (design-only)
     no_eval: bool = False
+    # Cached result of the extras check; extras don't change while a definition is loaded
+    _extras_met: Optional[bool] = None
 
     def check_requirements(self, doc) -> bool:
         """Check if the requirements for this stage are met for the given document."""
@@ -86,16 +88,8 @@ class StageDefinition(BaseModel):
             return True
 
         # Check extras/feature requirements first (static, independent of document)
-        feature_list = self.requirements.extras
-        if feature_list:
-            try:
-                from .optional_deps import is_optional_dependency_installed
-                for feature in feature_list:
-                    if not is_optional_dependency_installed(feature):
-                        return False
-            except Exception:
-                # If the feature check fails, consider requirements not met
-                return False
+        if self.requirements.extras and not self._check_extras():
+            return False
 
         # Check file presence requirements
         if self.requirements.file_presence:
@@ -119,6 +113,19 @@ class StageDefinition(BaseModel):
 
         return True
 
+    def _check_extras(self) -> bool:
+        """Check that all required extras are installed, once per loaded definition."""
+        if self._extras_met is None:
+            try:
+                from .optional_deps import is_optional_dependency_installed
+                self._extras_met = all(
+                    is_optional_dependency_installed(feature) for feature in self.requirements.extras
+                )
+            except Exception:
+                # If the feature check fails, consider requirements not met
+                self._extras_met = False
+        return self._extras_met
+
     def _check_file_presence_requirements(self, doc) -> bool:
         """Check file presence requirements."""
         fp_req = self.requirements.file_presence
@@ -147,17 +154,13 @@ class StageDefinition(BaseModel):
 
     def _check_stage_requirements(self, doc) -> bool:
         """Check stage requirements."""
+        stages = doc.stages
         for stage_name, stage_req in self.requirements.stages.items():
-            matching_stages = doc.get_stages(stage_name)
-            if not matching_stages:
-                return False
-
-            # Check if any stage with this name has the required status
-            has_required_status = any(
-                stage.status == stage_req.status
-                for stage in matching_stages
-            )
-            if not has_required_status:
+            # Some stage with this name must have the required status
+            if not any(
+                stage.name == stage_name and stage.status == stage_req.status
+                for stage in stages
+            ):
                 return False
 
         return True
@@ -563,6 +566,10 @@ class StageDefinitions:
         """List all available stage definition names."""
         return list(self._definitions.keys())
 
+    def iter_definitions(self) -> Iterator[Tuple[str, StageDefinition]]:
+        """Iterate over (name, definition) pairs of all loaded stage definitions."""
+        return iter(self._definitions.items())
+
     def reload(self) -> None:
         """Reload all stage definitions from files."""
         self._definitions.clear()
@@ -1,13 +1,45 @@
 from __future__ import annotations
+import contextlib
+import io
 import json
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from .conductor_client import upload_workflow, _get_base_url, _get_headers
 
 # TODO: upload_tasks wird nicht mehr benötigt oder?
 # TODO: check ob die workflow updates gut gemacht sind. Eigentlich sollen keine Löschungen (für ein replace) erfolgen (sondern erhöhte versionsnr); bzw. wenn dann, nur über eine force definition
 # TODO: erstellung eigener task zum dedizierten workflow delete
 
+class _ThreadOutput(io.TextIOBase):
+    """stdout stand-in that collects what each pool task prints.
+
+    Prints from threads inside :meth:`capture` go to that task's buffer, so
+    the caller can print them in order; everything else passes through.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def capture(self, func, *args, **kwargs) -> Tuple[Any, str]:
+        """Call ``func`` and return its result with the text it printed."""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(*args, **kwargs), self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
+
 class WorkflowManager:
     """Manages workflow and task definitions for Conductor."""
 
@@ -151,53 +183,94 @@ class WorkflowManager:
             print(f"Warning: Could not check workflow {name} in Conductor: {e}")
             return False
 
-    def upload_workflows(self, force: bool = False) -> Dict[str, bool]:
-        """Upload all workflows to Conductor."""
+    def upload_workflows(self, force: bool = False, names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """Upload all workflows to Conductor.
+
+        If ``names`` is given, only workflows with those names are uploaded;
+        requested names without a local workflow file are reported as failed.
+        """
         results = {}
         uploaded_workflows = []
         skipped_workflows = []
+        wanted = set(names) if names is not None else None
         workflows = self.discover_workflows()
 
-        print(f"Found {len(workflows)} workflow files")
+        if wanted is None:
+            print(f"Found {len(workflows)} workflow files")
 
+        pending: List[Tuple[str, Path, Dict[str, Any]]] = []
         for workflow_file in workflows:
             workflow_def = self.load_workflow_definition(workflow_file)
             if not workflow_def:
-                results[workflow_file.name] = False
+                if wanted is None:
+                    results[workflow_file.name] = False
                 continue
 
             workflow_name = workflow_def.get('name')
             if not workflow_name:
-                print(f"No name found in workflow {workflow_file}")
-                results[workflow_file.name] = False
+                if wanted is None:
+                    print(f"No name found in workflow {workflow_file}")
+                    results[workflow_file.name] = False
                 continue
 
-            # Check if upload is needed
-            if not force and not self.needs_upload(workflow_name, workflow_file, is_workflow=True):
+            if wanted is None or workflow_name in wanted:
+                pending.append((workflow_name, workflow_file, workflow_def))
+
+        if wanted is not None:
+            # Requested names in sorted order, first file per name; names
+            # without a local file have no file or definition
+            found: Dict[str, Tuple[str, Path, Dict[str, Any]]] = {}
+            for item in pending:
+                found.setdefault(item[0], item)
+            pending = [found.get(name, (name, None, None)) for name in sorted(wanted)]
+
+        # Each check/upload is an independent Conductor round-trip; what they
+        # print is collected per workflow and printed here in order
+        output = _ThreadOutput(sys.stdout)
+
+        def check_and_upload(item):
+            workflow_name, workflow_file, workflow_def = item
+            if workflow_file is None:
+                return None, ""
+            return output.capture(self._upload_if_needed, workflow_name, workflow_file, workflow_def, force=force)
+
+        with contextlib.redirect_stdout(output), \
+                ThreadPoolExecutor(max_workers=min(8, len(pending) or 1)) as executor:
+            outcomes = list(executor.map(check_and_upload, pending))
+
+        for (workflow_name, workflow_file, _), (outcome, printed) in zip(pending, outcomes):
+            print(printed, end="")
+            if workflow_file is None:
+                print(f"Workflow '{workflow_name}' not found in local files")
+                results[workflow_name] = False
+            elif outcome is None:
                 print(f"Workflow {workflow_name} is up to date (already exists in Conductor)")
                 results[workflow_name] = True
                 skipped_workflows.append(workflow_name)
-                continue
-
-            # Upload workflow
-            success = upload_workflow(workflow_def)
-            results[workflow_name] = success
-
-            if success:
+            elif outcome:
                 print(f"✓ Uploaded workflow: {workflow_name}")
+                results[workflow_name] = True
                 uploaded_workflows.append(workflow_name)
             else:
                 print(f"✗ Failed to upload workflow: {workflow_name}")
+                results[workflow_name] = False
 
         # Store results for summary
         self._last_upload_results = {
             'uploaded': uploaded_workflows,
             'skipped': skipped_workflows,
-            'total': len(workflows)
+            'total': len(workflows) if wanted is None else len(wanted)
         }
 
         return results
 
+    def _upload_if_needed(self, workflow_name: str, workflow_file: Path,
+                          workflow_def: Dict[str, Any], force: bool = False) -> Optional[bool]:
+        """Upload one workflow unless it is up to date; None means skipped."""
+        if not force and not self.needs_upload(workflow_name, workflow_file, is_workflow=True):
+            return None
+        return upload_workflow(workflow_def)
+
     def upload_single_workflow(self, workflow_name: str, force: bool = False) -> Dict[str, bool]:
         """Upload a single workflow by name."""
         results = {}
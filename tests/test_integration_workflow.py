@@ -292,7 +292,9 @@ class TestWorkerManagementIntegration:
 pgr       1234  0.1  0.2  23456  7890 pts/0    S+   10:01   0:00 python -m idflow worker start --worker update_stage_status
 """
 
-        with patch('subprocess.run') as mock_run:
+        # Without /proc the commands fall back to the mocked ps output
+        with patch('idflow.cli.worker.worker._PROC_ROOT', '/nonexistent'), \
+             patch('subprocess.run') as mock_run:
             mock_run.return_value.returncode = 0
             mock_run.return_value.stdout = mock_ps_output
 
@@ -309,7 +311,9 @@ pgr       1234  0.1  0.2  23456  7890 pts/0    S+   10:01   0:00 python -m idflo
 pgr       1234  0.1  0.2  23456  7890 pts/0    S+   10:01   0:00 python -m idflow worker start --worker update_stage_status
 """
 
-        with patch('subprocess.run') as mock_run:
+        # Without /proc the commands fall back to the mocked ps output
+        with patch('idflow.cli.worker.worker._PROC_ROOT', '/nonexistent'), \
+             patch('subprocess.run') as mock_run:
             mock_run.return_value.returncode = 0
             mock_run.return_value.stdout = mock_ps_output
 
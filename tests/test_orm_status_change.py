@@ -171,6 +171,20 @@ class TestORMStatusChange:
         assert moved_test_file.exists(), "Test file should be moved with document"
         assert moved_test_file.read_text() == "This is a test file", "File content should be preserved"
 
+    def test_copy_file_creates_file_ref(self, temp_workspace, tmp_path):
+        """Test that copy_file copies the content and registers a file reference."""
+        src = tmp_path / "upload.bin"
+        src.write_bytes(b"\x00\x01payload" * 1024)
+
+        doc = create_document(status="inbox", title="Test Document")
+        doc.create()
+        file_ref = doc.copy_file(src, "attachment")
+
+        copied = doc.get_file_path(file_ref)
+        assert copied.read_bytes() == src.read_bytes()
+        assert file_ref.filename == "upload.bin"
+        assert file_ref.key == "attachment"
+
     def test_status_change_with_stages(self, temp_workspace):
         """Test that status change moves stages with the document."""
         # Create a document in inbox
@@ -249,6 +263,19 @@ Planning stage content""")
         assert found_doc.id == doc.id
         assert found_doc.status == "active"
 
+    def test_iter_where_streams_matching_documents(self, temp_workspace):
+        """Test that iter_where lazily yields the same documents as where."""
+        inbox_doc = create_document(status="inbox", title="Inbox Document")
+        inbox_doc.create()
+        active_doc = create_document(status="active", title="Active Document")
+        active_doc.create()
+
+        DocumentClass = get_document_class()
+        docs = DocumentClass.iter_where(status="inbox")
+
+        assert not isinstance(docs, list)
+        assert [d.id for d in docs] == [inbox_doc.id]
+
     def test_status_change_no_duplicate_directories(self, temp_workspace):
         """Test that status change doesn't create duplicate directories."""
         # Create a document in inbox
@@ -16,6 +16,13 @@ from pathlib import Path
 from idflow.cli.worker.worker import list_running_workers, kill_workers
 
 
+@pytest.fixture(autouse=True)
+def ps_fallback(tmp_path):
+    """Hide /proc so the commands read the mocked ``ps`` output."""
+    with patch('idflow.cli.worker.worker._PROC_ROOT', str(tmp_path / "no-proc")):
+        yield
+
+
 class TestWorkerProcessListing:
     """Test the worker process listing functionality."""
 
@@ -321,6 +328,104 @@ usr       1234  0.1  0.2  23456  7890 pts/0    S+   10:01   0:00 python -m idflo
                 assert any("No worker processes found matching pattern 'update_stage_status'" in str(call) for call in echo_calls)
 
 
+class TestWorkerDiscovery:
+    """Test worker file scanning."""
+
+    def test_discover_worker_files_rescans_changed_files(self, tmp_path):
+        """Test that discovery reports worker files and picks up file changes."""
+        from idflow.cli.worker.worker import discover_worker_files
+
+        task_file = tmp_path / "my_task.py"
+        task_file.write_text("@worker_task(task_definition_name='first')\ndef run(): pass\n")
+        helper_file = tmp_path / "helper.py"
+        helper_file.write_text("def helper(): pass\n")
+
+        with patch('idflow.core.resource_resolver.ResourceResolver.collect_flattened_files',
+                   return_value=[task_file, helper_file]):
+            assert discover_worker_files() == [(task_file, "first")]
+
+            task_file.write_text("@worker_task(task_definition_name='second_name')\ndef run(): pass\n")
+            assert discover_worker_files() == [(task_file, "second_name")]
+
+            task_file.write_text("def run(): pass\n")
+            assert discover_worker_files() == []
+
+
+class TestWorkerProcessClassification:
+    """Test classifying worker processes from a process snapshot."""
+
+    def test_classifies_process_tree_from_one_snapshot(self):
+        """Test that cli, task-mgr and worker are told apart with a single scan."""
+        from idflow.cli.worker import worker as worker_mod
+
+        procs = {
+            100: worker_mod._ProcInfo(1, "python -m idflow worker start --all"),
+            101: worker_mod._ProcInfo(100, "python -m idflow worker start --all"),
+            102: worker_mod._ProcInfo(100, "python -m idflow worker start --all"),
+        }
+        with patch.object(worker_mod, '_snapshot_procs', return_value=procs) as mock_snapshot:
+            with worker_mod.oneshot():
+                table = worker_mod._process_table()
+                types = [worker_mod._classify_worker_process(pid, 0.5, table) for pid in (100, 101, 102)]
+                assert worker_mod.is_child_process(101, 100)
+                assert not worker_mod.is_child_process(100, 101)
+
+        assert types == ["cli", "task-mgr", "worker"]
+        mock_snapshot.assert_called_once()
+
+    def test_task_manager_is_first_child_started(self):
+        """Test that start time, not PID order, picks the task manager after PID wraparound."""
+        from idflow.cli.worker import worker as worker_mod
+
+        command = "python -m idflow worker start --all"
+        table = worker_mod._ProcTable({
+            500: worker_mod._ProcInfo(1, command, 1000),
+            900: worker_mod._ProcInfo(500, command, 1010),
+            20: worker_mod._ProcInfo(500, command, 1020),
+        })
+
+        assert worker_mod.determine_process_type(900, 500, 2.0, table) == "task-mgr"
+        assert worker_mod.determine_process_type(20, 500, 0.1, table) == "worker"
+
+    def test_parse_stat_handles_spaces_in_command_name(self):
+        """Test that /proc stat fields are read after the parenthesised comm."""
+        from idflow.cli.worker.worker import _parse_stat
+
+        fields = ["S", "42"] + ["0"] * 17 + ["123456", "0", "789"]
+        buf = b"1234 (idflow (w) x) " + " ".join(fields).encode() + b"\n"
+
+        assert _parse_stat(buf) == (1234, 42, 123456, 789)
+
+    def test_ps_reads_proc_without_spawning_ps(self, tmp_path):
+        """Test that worker ps builds its rows from /proc when it is available."""
+        from idflow.cli.worker import worker as worker_mod
+
+        proc = tmp_path / "proc"
+        proc.mkdir()
+        (proc / "uptime").write_text("12.00 4.00\n")
+        (proc / "meminfo").write_text("MemTotal:        8000000 kB\n")
+        command = ["python", "-m", "idflow", "worker", "start", "--worker", "review"]
+        # The CLI runs on pts/0 (major 136) and has used 0.5s of CPU in 2s
+        for pid, ppid, starttime, tty_nr, utime in [(100, 1, 1000, 136 << 8, 50), (101, 100, 1010, 0, 0), (102, 100, 1020, 0, 0)]:
+            fields = ["S", str(ppid), str(pid), str(pid), str(tty_nr), "-1"] + ["0"] * 5 + [str(utime)] + ["0"] * 7 + [str(starttime), "123456789", "1000"]
+            (proc / str(pid)).mkdir()
+            (proc / str(pid) / "stat").write_text(f"{pid} (python) " + " ".join(fields) + "\n")
+            (proc / str(pid) / "statm").write_text("30141 1000 500 1 0 200 0\n")
+            (proc / str(pid) / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in command) + b"\0")
+
+        with patch.object(worker_mod, '_PROC_ROOT', str(proc)), \
+             patch.object(worker_mod, '_user_name', return_value="usr"), \
+             patch('subprocess.run') as mock_run, \
+             patch('typer.echo') as mock_echo:
+            list_running_workers(full_command=False)
+
+        mock_run.assert_not_called()
+        rows = [str(c) for c in mock_echo.call_args_list if "review (" in str(c)]
+        assert len(rows) == 3
+        assert "(cli)" in rows[0] and "(task-mgr)" in rows[1] and "(worker)" in rows[2]
+        assert "pts/0" in rows[0] and "25.0" in rows[0]
+
+
 class TestWorkerOutputFormatting:
     """Test worker command output formatting."""
 
@@ -408,11 +513,10 @@ class TestWorkerSignalHandling:
         mock_task_handler = MagicMock()
 
         # Mock worker files to ensure we have workers to start
-        mock_worker_files = [Path("test_worker.py")]
+        mock_worker_files = [(Path("test_worker.py"), "test_worker")]
 
-        with patch('idflow.cli.worker.worker.TaskHandler', return_value=mock_task_handler), \
+        with patch('conductor.client.automator.task_handler.TaskHandler', return_value=mock_task_handler), \
              patch('idflow.cli.worker.worker.discover_worker_files', return_value=mock_worker_files), \
-             patch('idflow.cli.worker.worker.extract_task_name_from_file', return_value="test_worker"), \
              patch('idflow.cli.worker.worker.load_task_function'), \
              patch('typer.echo') as mock_echo, \
              patch('signal.signal') as mock_signal, \
@@ -439,11 +543,10 @@ class TestWorkerSignalHandling:
         mock_task_handler = MagicMock()
 
         # Mock worker files to ensure we have workers to start
-        mock_worker_files = [Path("test_worker.py")]
+        mock_worker_files = [(Path("test_worker.py"), "test_worker")]
 
-        with patch('idflow.cli.worker.worker.TaskHandler', return_value=mock_task_handler), \
+        with patch('conductor.client.automator.task_handler.TaskHandler', return_value=mock_task_handler), \
              patch('idflow.cli.worker.worker.discover_worker_files', return_value=mock_worker_files), \
-             patch('idflow.cli.worker.worker.extract_task_name_from_file', return_value="test_worker"), \
              patch('idflow.cli.worker.worker.load_task_function'), \
              patch('typer.echo') as mock_echo, \
              patch('signal.signal') as mock_signal, \
@@ -476,11 +579,10 @@ class TestWorkerSignalHandling:
         mock_task_handler.stop_processes.side_effect = Exception("Stop error")
 
         # Mock worker files to ensure we have workers to start
-        mock_worker_files = [Path("test_worker.py")]
+        mock_worker_files = [(Path("test_worker.py"), "test_worker")]
 
-        with patch('idflow.cli.worker.worker.TaskHandler', return_value=mock_task_handler), \
+        with patch('conductor.client.automator.task_handler.TaskHandler', return_value=mock_task_handler), \
              patch('idflow.cli.worker.worker.discover_worker_files', return_value=mock_worker_files), \
-             patch('idflow.cli.worker.worker.extract_task_name_from_file', return_value="test_worker"), \
              patch('idflow.cli.worker.worker.load_task_function'), \
              patch('typer.echo') as mock_echo, \
              patch('signal.signal') as mock_signal, \